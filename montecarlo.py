@@ -1,456 +1,3219 @@
-import random as rd
-from itertools import product
+import importlib
+import importlib.util
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations_with_replacement, product
+from statistics import NormalDist
 
 import numpy as np
-import pandas as pd
 
 
-class Die:
+class _LazyModule:
     """
     PURPOSE:
-    A class accepts variety of random variables associated with stochastic
-    processes and rolls/runs and returns a list of outcomes
+    Stand in for a module that is only imported the first time one of its attributes is used
 
     ATTRIBUTES:
-    Takes a list of faces
+    Takes the module name and the global name it is imported as
 
     METHODS:
-    __init__::Return a dataframe with faces and weights column
-    change_weight:: Changes the weight of a single side/face.
-    roll_die:: Roll/Run the die one or more times
-    show_state:: Display the current set of the faces and weights
+    __getattr__:: Import the module, put it in place of the stand-in and look the attribute up
     -------------------------------------------------------------------------
     """
 
-    def __init__(self, faces):
+    def __init__(self, name, alias):
         """
         PURPOSE:
-        Initializes private dataframe containing faces and weights respectively
+        Initializes the stand-in of a module
 
         INPUTS:
-        Takes a List of faces ([int | str | float])
+        Takes the module name (str) and the global name of the stand-in (str)
 
         OUTPUTS:
-        Return a dataframe with faces and weights column (DataFrame(int | str | float))
+        Assigns the module name and alias
         """
-        self.faces = list(set(faces))  # The faces must be unique
-        self.weights = np.ones(len(faces))  # Initialize the weight to 1.0
-        self.faces_weights_df = pd.DataFrame(self.faces, columns=['faces'])
-        self.faces_weights_df = self.faces_weights_df.assign(weights=self.weights)
+        self._name = name
+        self._alias = alias
 
-    # Change the weight of a single side
-    def change_weight(self, face_value, new_weight):
+    def __getattr__(self, attribute):
         """
         PURPOSE:
-        Change the weight of a single side/face
+        Import the module on first use
 
-        INPUTS: Takes two arguments face value (int | str | float) to be changed and the new weight (int |
-        str | float)
+        INPUTS:
+        Takes the attribute name (str)
 
         OUTPUTS:
-        Assigns a dataframe with faces and the newly assigned weights (DataFrame(int | str | float))
+        Returns the module attribute, later lookups go to the module itself
         """
-        # face passed must be valid
-        is_face_valid = (lambda face_values: face_values in self.faces)
-        if not is_face_valid(face_value):
-            return "Error:The face passed is invalid."
-        # Weight passed must be valid
-        is_weight_valid = isinstance(new_weight, float) | isinstance(new_weight, int) | isinstance(new_weight, bool)
-        if not is_weight_valid:
-            return "Error:The Weight passed is invalid."
-        self.faces_weights_df.iloc[self.faces.index(face_value), [1]] = new_weight
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attribute)
 
-    # Roll the die one or more times
-    def roll_die(self, number_of_rolls=1):
+
+# pandas is only imported once a DataFrame is actually needed, rolling dice does not need it
+pd = _LazyModule('pandas', 'pd')
+
+# Rolls drawn from one child seed in a parallel play, fixed so the result does not depend on the worker count
+PARALLEL_BLOCK_ROLLS = 2 ** 17
+
+# Dice, faces and shared result matrix of a parallel play worker process
+_worker_state = {}
+
+
+# Games up to this many rolls x dice are run by the pure Python backend, which skips the numpy setup cost
+PYTHON_BACKEND_MAX_CELLS = 64
+# Games from this many rolls x dice are run by the numba backend when numba is installed, so the compile time pays off
+NUMBA_BACKEND_MIN_CELLS = 2 ** 22
+
+
+class PythonBackend:
+    """
+    PURPOSE:
+    Reference backend running the sampling and analysis kernels in plain Python, every other backend must give
+    identical results
+
+    ATTRIBUTES:
+    Takes no argument
+
+    METHODS:
+    is_available:: Tell whether the backend can run here
+    alias_codes:: Turn alias table draws into face codes
+    face_counts:: Count the faces of every roll
+    row_keys:: Encode every roll as one mixed-radix integer key
+    -------------------------------------------------------------------------
+    """
+
+    name = 'python'
+
+    def is_available(self):
         """
         PURPOSE:
-        Roll the die one or more times
+        Tell whether the backend can run here
 
         INPUTS:
-        Takes one argument which is Number of rolls (int)
+        Takes no argument
 
         OUTPUTS:
-        Return a list of outcomes similar to the face types ([int | str | float]).
+        Returns True, plain Python always runs (bool)
         """
-        return [rd.choice(self.faces) for _ in range(number_of_rolls)]
+        return True
 
-    # Show the user the die’s current set of faces and weights
-    def show_state(self):
+    def alias_codes(self, columns, uniforms, probability, alias):
         """
         PURPOSE:
-        Show the die’s current set of faces and weights(could be changed by change_weight)
+        Turn the alias table draws of a weighted die into face codes
 
         INPUTS:
-        Takes no argument
+        Takes the column drawn and the uniform drawn for every roll (np.ndarray(int), np.ndarray(float)) and the
+        acceptance probability and alias of every face (np.ndarray(float), np.ndarray(int))
 
         OUTPUTS:
-        Returns the dataframe according to the face types (DataFrame(int | str | float)).
+        Returns the face code of every roll (np.ndarray(int))
         """
-        return self.faces_weights_df
+        probability, alias = probability.tolist(), alias.tolist()
+        return np.array([column if uniform < probability[column] else alias[column]
+                         for column, uniform in zip(columns.tolist(), uniforms.tolist())], dtype=np.int64)
+
+    def face_counts(self, codes, face_count, dtype):
+        """
+        PURPOSE:
+        Count how many dice show every face, roll by roll
 
+        INPUTS:
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)), the number of faces (int) and the
+        count type (np.dtype)
 
-class Game:
+        OUTPUTS:
+        Returns the face counts of shape N rolls by F faces (np.ndarray(uint))
+        """
+        counts = [[0] * face_count for _ in range(len(codes))]
+        for roll_counts, roll in zip(counts, codes.tolist()):
+            for code in roll:
+                roll_counts[code] += 1
+        return np.array(counts, dtype=dtype).reshape(len(codes), face_count)
+
+    def row_keys(self, codes, face_count):
+        """
+        PURPOSE:
+        Encode every roll as one integer key, the face codes read as the digits of a base F number
+
+        INPUTS:
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)) and the number of faces (int), F^M
+        must fit an int64
+
+        OUTPUTS:
+        Returns the key of every roll (np.ndarray(int))
+        """
+        keys = []
+        for roll in codes.tolist():
+            key = 0
+            for code in roll:
+                key = key * face_count + code
+            keys.append(key)
+        return np.array(keys, dtype=np.int64)
+
+
+class NumpyBackend(PythonBackend):
     """
     PURPOSE:
-    A class to roll one or more dice of the same kind one or more times.
-    Inherits methods from Die class to perform the simulations
+    Backend running the sampling and analysis kernels as whole-array numpy operations
 
     ATTRIBUTES:
-    Takes a list of similarly defined dice (Die Objects/instances).
+    Takes no argument
 
     METHODS:
-    __init__:: Instantiate a similar Die Objects.
-    play:: Rolls the Dice using the inherited roll_die method from the Die class
-    show:: Display the results of the most recent play
+    alias_codes:: Turn alias table draws into face codes
+    face_counts:: Count the faces of every roll
+    row_keys:: Encode every roll as one mixed-radix integer key
     -------------------------------------------------------------------------
     """
 
-    def __init__(self, dice):
+    name = 'numpy'
+
+    def alias_codes(self, columns, uniforms, probability, alias):
         """
         PURPOSE:
-        Initializes dice object which is inherited from the Die Class
+        Turn the alias table draws of a weighted die into face codes
 
         INPUTS:
-        Takes one argument which is a List of Dice Objects ([int | str | float])
+        Takes the column drawn and the uniform drawn for every roll (np.ndarray(int), np.ndarray(float)) and the
+        acceptance probability and alias of every face (np.ndarray(float), np.ndarray(int))
 
         OUTPUTS:
-        Assigns internal dice variable for use in multiple areas (DataFrame(int | str | float))
+        Returns the face code of every roll (np.ndarray(int))
         """
-        # Take the list of dice
-        self.dice = dice
-        self.cols = []
-        self.columns = []
-        self.play_df = pd.DataFrame()
-        self.number_of_rolls = 0
-        self.play_result_df_list = []
+        return np.where(uniforms < probability[columns], columns, alias[columns])
 
-    # Rolls the Dice
-    def play(self, number_of_rolls):
+    def face_counts(self, codes, face_count, dtype):
         """
         PURPOSE:
-        Rolls the Dice using the inherited roll_die method from the Die class
+        Count how many dice show every face, roll by roll
 
         INPUTS:
-        Takes one parameter to specify how many times the dice should be rolled.(int)
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)), the number of faces (int) and the
+        count type (np.dtype)
 
-        OUTPUTS: Saves the result of the play to a private dataframe of shape N rolls by M dice. (DataFrame(int |
-        str | float))
+        OUTPUTS:
+        Returns the face counts of shape N rolls by F faces (np.ndarray(uint))
         """
-        # assign and make the Number of rolls accessible
-        self.number_of_rolls = number_of_rolls
-        self.play_result_df_list = []
-        roll_data = []
-        # Filter out the Die for M Column
-        self.columns = ["Die " + str(index + 1) for index, dice in enumerate(self.dice)]
-        # Pull out the Cols temporary
-        for roll in self.dice:
-            self.cols = [str(die) for die in roll.faces]
-
-        # Iterate through the list of dice and perform the same operations
-        for roll in range(self.number_of_rolls):
-            each_roll_results = []
-            for d in self.dice:
-                # Roll the dice Once append the results in temporary list for use
-                each_roll_results.append(d.roll_die(1)[0])
-            roll_data.append(each_roll_results)
-
-            # Create a single dimension list with similar results populate across the horizontal list
-        index = [i for i in range(1, len(roll_data) + 1)]
-        # Create the play Dataframe from the roll_data , index and columns
-        self.play_df = pd.DataFrame(roll_data,
-                                    index=index,
-                                    columns=self.columns)
-        self.play_df.index.name = 'roll number'
-        return self.play_df
-
-    # Display the Dice results
-    # Default df return form is Wide = 1 and Narrow option is 2
-    def show(self, play_result_df, df_form=1):
+        # Each die adds one to the column of the face it rolled, for every roll at once
+        counts = np.zeros((len(codes), face_count), dtype=dtype)
+        rows = np.arange(len(codes))
+        for position in range(codes.shape[1]):
+            counts[rows, codes[:, position]] += 1
+        return counts
+
+    def row_keys(self, codes, face_count):
         """
         PURPOSE:
-        Show the results of the most recent play.
+        Encode every roll as one integer key, the face codes read as the digits of a base F number
 
-        INPUTS: Takes two arguments the play dataframe (DataFrame(int | str | float)) and df_form (int) that
-        means the default Wide = 1 and Narrow option is 2 as parameters
+        INPUTS:
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)) and the number of faces (int), F^M
+        must fit an int64
 
-        OUTPUTS: Display the result of the play result as a dataframe of shape N rolls by M dice.(DataFrame(int |
-        str | float))
+        OUTPUTS:
+        Returns the key of every roll (np.ndarray(int))
         """
-        if df_form != 1 and df_form != 2:
-            return print("Error:The dataframe display format option can only be Wide(value 1) or Narrow(value 2).")
-
-        self.play_result_df_list.append(play_result_df)
-
-        if df_form == 1:
-            return play_result_df
-        else:
-            return pd.melt(play_result_df, value_vars=self.cols, var_name='die number', value_name='face rolled',
-                           ignore_index=False)
+        radix = face_count ** np.arange(codes.shape[1] - 1, -1, -1, dtype=np.int64)
+        return codes.astype(np.int64) @ radix
 
 
-class Analyzer:
+class NumbaBackend(PythonBackend):
     """
     PURPOSE:
-    A class to take the results of a single game and compute statistical properties about it.
+    Backend running the sampling and analysis kernels as loops compiled by numba, only available when numba is
+    installed
 
     ATTRIBUTES:
+    Takes no argument
 
-    METHODS: __init__:: Instantiate a Game Objects from the Game Class and infers the data type of the die faces.
-    face counts per roll, i.e. the number of times a given face appeared in each roll. For example, if a roll of five
-    dice has all sixes, then the counts for this roll would be 6 for the face value '6' and 0 for the other faces.
-    jackpot count, i.e. how many times a roll resulted in all faces being the same, e.g. six ones for a six-sided
-    die. combo count, i.e. how many combination types of faces were rolled and their counts. permutation count,
-    i.e. how may sequence types were rolled and their counts.
+    METHODS:
+    is_available:: Tell whether numba is installed
+    alias_codes:: Turn alias table draws into face codes
+    face_counts:: Count the faces of every roll
+    row_keys:: Encode every roll as one mixed-radix integer key
     -------------------------------------------------------------------------
     """
 
-    def __init__(self, game):
+    name = 'numba'
+
+    def __init__(self):
         """
         PURPOSE:
-        Initializes the game object which is inherited from the Game Class
+        Initializes the backend, the kernels are compiled on first use
 
         INPUTS:
-        Takes one argument which is a Game Object
+        Takes no argument
 
         OUTPUTS:
-        Assigns Game Object for internal use , Game dataframe type (int | str | float),
-        Result of the Game played([int | str | float])
+        Assigns an empty table of compiled kernels
         """
-        self.game = game
-        # Infers the data type of the die faces
-        self.game_df_data_type = type(game.dice[0].faces[1])
-        self.game_result = game.play_result_df_list
-        self.game_result_df = game.play_df
-        # Face count
-        self.face_count_df = pd.DataFrame()
-        self.face_list = []
-        # Jackpot
-        self.jackpot_list = []
-        self.jackpot_results_df = pd.DataFrame()
-        self.jackpot_results_df.index.name = ''
-        self.jack_pot_indices = []
-        # Combination
-        self.combination_list = []
-        self.combination_df = pd.DataFrame()
-        # Permutation
-        self.permutation_list = []
-        self.permutation_df = pd.DataFrame()
+        self._kernels = None
 
-        # Method to compute how many times a given face is rolled in each event
-
-    def face_count(self):
+    def is_available(self):
         """
         PURPOSE:
-        Method to compute how many times a given face is rolled in each event
+        Tell whether numba is installed, without importing it
 
         INPUTS:
         Takes no argument
 
         OUTPUTS:
-        Returns the Face Count dataframe according to the initial dice face type (DataFrame(int | str | float))
+        Returns True when numba can be imported (bool)
         """
-        index = [i for i in range(1, self.game.number_of_rolls + 1)]
-        self.face_count_df = pd.DataFrame(index=index, columns=self.game.cols)
-        self.face_count_df.index.name = 'roll number'
-        self.face_list = np.zeros(len(self.game.cols),
-                                  dtype=int)  # Hold the face value and increment when new similar value is found.
-        # Uses Game Cols Structure Copy
-
-        for index, row in self.game_result_df.iterrows():
-            for col in self.game.columns:
-                self.face_list[self.game.cols.index(str(row[col]))] = self.face_list[
-                                                                          self.game.cols.index(str(row[col]))] + 1
+        return importlib.util.find_spec('numba') is not None
 
-                # Append the new face counts to the dataframe
-            self.face_count_df.loc[index] = self.face_list
-            self.face_list = np.zeros(len(self.game.cols), dtype=int)  # Flush the temporary list
-
-        return self.face_count_df
-
-    # Method to compute how many times the game resulted in all faces being identical
-    def jackpot(self):
+    def _compiled(self):
         """
         PURPOSE:
-        Method to compute how many times the game resulted in all faces being identical
+        Compile the kernels the first time they are needed
 
         INPUTS:
         Takes no argument
 
         OUTPUTS:
-        Returns the count of how many times the game resulted in all faces being identical
-        You can also access the Jackpot Dataframe using Class Analyzer.jackpot_results_df
+        Returns the compiled alias, face count and row key kernels (dict)
         """
-        self.jackpot_results_df = pd.DataFrame(columns=self.game.cols)
-        self.jackpot_results_df.index.name = 'roll number'
-        self.jack_pot_indices = []
-        self.jackpot_list = np.zeros(len(self.game.cols),
-                                     dtype=int)  # Hold the face value and increment when new similar value is found.
-        # Uses Game Cols Structure Copy
-
-        for index, row in self.game_result_df.iterrows():
-            for col in self.game.columns:
-                self.jackpot_list[self.game.cols.index(str(row[col]))] = self.jackpot_list[
-                                                                             self.game.cols.index(str(row[col]))] + 1
-                # Save the index only if all values result in similar faces, which is equal to number of cols
-            if len(self.game.dice) in self.jackpot_list:
-                self.jackpot_list[self.jackpot_list != len(self.game.dice)] = 0
-                # Append the Index for the dataframe
-                self.jack_pot_indices.append(index + 1)
-                # Append the new face counts to the jackpot_results dataframe
-                self.jackpot_results_df.loc[index] = self.jackpot_list
-
-            self.jackpot_list = np.zeros(len(self.game.cols), dtype=int)
-
-        return len(self.jackpot_results_df.index)
+        if self._kernels is not None:
+            return self._kernels
+        numba = importlib.import_module('numba')
+
+        @numba.njit(cache=True)
+        def alias_codes(columns, uniforms, probability, alias):
+            codes = np.empty(len(columns), dtype=np.int64)
+            for roll in range(len(columns)):
+                column = columns[roll]
+                codes[roll] = column if uniforms[roll] < probability[column] else alias[column]
+            return codes
+
+        @numba.njit(cache=True)
+        def face_counts(codes, counts):
+            for roll in range(codes.shape[0]):
+                for position in range(codes.shape[1]):
+                    counts[roll, codes[roll, position]] += 1
+            return counts
+
+        @numba.njit(cache=True)
+        def row_keys(codes, face_count):
+            keys = np.zeros(codes.shape[0], dtype=np.int64)
+            for roll in range(codes.shape[0]):
+                key = 0
+                for position in range(codes.shape[1]):
+                    key = key * face_count + codes[roll, position]
+                keys[roll] = key
+            return keys
+
+        self._kernels = {'alias_codes': alias_codes, 'face_counts': face_counts, 'row_keys': row_keys}
+        return self._kernels
+
+    def alias_codes(self, columns, uniforms, probability, alias):
+        """
+        PURPOSE:
+        Turn the alias table draws of a weighted die into face codes
 
-        # Combo method to compute the distinct/unique combinations of faces rolled, along with their counts
+        INPUTS:
+        Takes the column drawn and the uniform drawn for every roll (np.ndarray(int), np.ndarray(float)) and the
+        acceptance probability and alias of every face (np.ndarray(float), np.ndarray(int))
 
-    # Count is always 1 because the specific combination only occurs Once
-    def combo(self):
+        OUTPUTS:
+        Returns the face code of every roll (np.ndarray(int))
+        """
+        return self._compiled()['alias_codes'](columns, uniforms, probability, alias)
+
+    def face_counts(self, codes, face_count, dtype):
         """
         PURPOSE:
-        Method to compute the distinct/unique combinations of faces rolled, along with their counts
+        Count how many dice show every face, roll by roll
 
         INPUTS:
-        Takes no argument
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)), the number of faces (int) and the
+        count type (np.dtype)
 
-        OUTPUTS: Returns the count of how many times the Game could result in distinct/unique combinations of faces
-        when dice is played/rolled You can also access the full combination multi-columned Dataframe using Class
-        Analyzer.combination_df or access the corresponding Class Analyzer.combination_list
+        OUTPUTS:
+        Returns the face counts of shape N rolls by F faces (np.ndarray(uint))
+        """
+        return self._compiled()['face_counts'](np.ascontiguousarray(codes),
+                                               np.zeros((len(codes), face_count), dtype=dtype))
 
+    def row_keys(self, codes, face_count):
         """
+        PURPOSE:
+        Encode every roll as one integer key, the face codes read as the digits of a base F number
 
-        # The faces that have been rolled by the dice game
-        face_combination_rolled = []
-
-        # The combination List of rolled dice with the respective count
-
-        # Check if the face has been rolled during the Game; and form a List[(tuples)]
-        die_faces_rolled = []
-        for index, row in self.game_result_df.iterrows():
-            for col in self.game.columns:
-                current_die_face = row[col]
-                die_faces_rolled.append(current_die_face)
-            face_combination_rolled.append(tuple(die_faces_rolled + [0]))  # Initialize with zero append
-            die_faces_rolled = []  # flush the list
-
-        # Check all possible values similarly to the permutation given below
-        check_face_presence = []
-        for index, row in self.game_result_df.iterrows():
-            for col in self.game.columns:
-                # Check the type of Dataframe type to conditionally pass casting
-                if self.game_df_data_type == int:
-                    if row[col] not in check_face_presence:
-                        check_face_presence.append(row[col])
-                elif self.game_df_data_type == str:
-                    if str(row[col]) not in check_face_presence:
-                        check_face_presence.append(row[col])
-                elif self.game_df_data_type == float:
-                    if row[col] not in check_face_presence:
-                        check_face_presence.append(row[col])
-
-        # Loop through the results array and add to the face_combo_list only if not present
-        # Extract only the Unique values
-        face_combo_list = list(set(check_face_presence))
-
-        # Sort the values
-        face_combo_list.sort(key=self.game_df_data_type)
-
-        # Perform the combination  of unique values and store it in self.permutation_df for public access
-        # initializing the range with the Number of Dice rolled
-        # using list comprehension to formulate all distinct permutation s of the elements
-        combo_list = [list(face_combo_list) for _ in range(len(self.game.dice))]
+        INPUTS:
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)) and the number of faces (int), F^M
+        must fit an int64
 
-        # using product() to get permutations
-        self.combination_list = list(product(*combo_list))
+        OUTPUTS:
+        Returns the key of every roll (np.ndarray(int))
+        """
+        return self._compiled()['row_keys'](np.ascontiguousarray(codes).astype(np.int64), face_count)
 
-        # Instantiate with 0 append to all values
-        self.combination_list = [tuple(list(tup) + [0]) for tup in self.combination_list]
 
-        # Construct the count for the combinations given
-        for passed in face_combination_rolled:
-            for index, tup in enumerate(self.combination_list):
-                if tup[:-1] == passed[:-1]:
-                    combination_increase = list(tup[-1:])[0] + 1
-                    self.combination_list[index] = self.combination_list[index][:-1] + (combination_increase,)
+# Backends by name, a backend added here can be picked with Game(dice, backend=name)
+BACKENDS = {backend.name: backend for backend in (PythonBackend(), NumpyBackend(), NumbaBackend())}
 
-        # Construct the combination  tuples indices
-        combination_indices_list = [tuple([i] * len(self.combination_list)) for i in range(len(self.combination_list))]
 
-        # Construct the Index name
-        combination_indices_name_list = ["roll_number " + str(index + 1) for index in range(len(self.combination_list))]
+def _select_backend(backend, cells):
+    """
+    PURPOSE:
+    Pick the backend running a problem: the one named, or for 'auto' the cheapest one for its size
 
-        # Create Row Level MultiIndex
-        combination_index = pd.MultiIndex.from_tuples(combination_indices_list, names=combination_indices_name_list)
+    INPUTS:
+    Takes the backend name (str) and the size of the problem in rolls x dice (int)
 
-        # Create Column Level MultiIndex
-        cols = pd.MultiIndex.from_tuples(self.combination_list)
-        # Create Data for the MultiIndex table
-        data = [[1 for _ in range(len(self.combination_list))] for _ in range(len(self.combination_list))]
-        # Construct the permutation  Dataframe
-        self.combination_df = pd.DataFrame(data, columns=cols, index=combination_index)
+    OUTPUTS:
+    Returns the backend (PythonBackend)
+    """
+    if backend == 'auto':
+        if cells <= PYTHON_BACKEND_MAX_CELLS:
+            return BACKENDS['python']
+        if cells >= NUMBA_BACKEND_MIN_CELLS and BACKENDS['numba'].is_available():
+            return BACKENDS['numba']
+        return BACKENDS['numpy']
+    if backend not in BACKENDS:
+        raise ValueError("The backend can only be 'auto' or one of {}.".format(", ".join(map(repr, BACKENDS))))
+    if not BACKENDS[backend].is_available():
+        raise ValueError("The {} backend is not installed.".format(backend))
+    return BACKENDS[backend]
 
-        # Return the count of all the unique combinations from the game
-        return len(list(set(face_combination_rolled)))
 
-    # Permutation order matters , so we will have to look through all the possible values
-    def permutation(self):
+class Die:
+    """
+    PURPOSE:
+    A class accepts variety of random variables associated with stochastic
+    processes and rolls/runs and returns a list of outcomes
+
+    ATTRIBUTES:
+    Takes a list of faces
+
+    METHODS:
+    __init__::Return a dataframe with faces and weights column
+    change_weight:: Changes the weight of a single side/face.
+    roll_die:: Roll/Run the die one or more times
+    show_state:: Display the current set of the faces and weights
+    -------------------------------------------------------------------------
+    """
+
+    # Many short-lived dice are created in sweeps, so they carry no per-instance dict
+    __slots__ = ('faces', 'weights', 'version', '_faces_weights_df', '_alias_table')
+
+    def __init__(self, faces):
         """
         PURPOSE:
-        Method to compute how may sequence types were rolled and their counts
+        Initializes the faces and their weights, the dataframe containing faces and weights respectively is built
+        on first use
 
         INPUTS:
-        Takes no argument
+        Takes a List of faces ([int | str | float])
 
         OUTPUTS:
-        Returns the count of all the possible combinations of faces present when dice is played/rolled
-        You can also access the permutation multi-columned Dataframe using Class Analyzer.permutation_df
+        Assigns the faces and a weight of 1.0 for each of them
         """
+        self.faces = list(set(faces))  # The faces must be unique
+        self.weights = np.ones(len(self.faces))  # Initialize the weight to 1.0
+        self._faces_weights_df = None
+        # Alias table built lazily from the weights on the next roll
+        self._alias_table = None
+        # Counts the weight changes so results computed from the old weights can be told apart
+        self.version = 0
 
-        # Check if the face has been rolled during the Game , checking presence
-        check_face_presence = []
-        for index, row in self.game_result_df.iterrows():
-            for col in self.game.columns:
-                # Check the type of Dataframe type to conditionally pass casting
-                if self.game_df_data_type == int:
-                    if row[col] not in check_face_presence:
-                        check_face_presence.append(row[col])
-                elif self.game_df_data_type == str:
-                    if str(row[col]) not in check_face_presence:
-                        check_face_presence.append(row[col])
-                elif self.game_df_data_type == float:
-                    if row[col] not in check_face_presence:
-                        check_face_presence.append(row[col])
-
-        # Loop through the results array and add to the face_permutation_list only if not present
-        # Extract only the Unique values
-        face_permutation_list = list(set(check_face_presence))
-
-        # Sort the values
-        face_permutation_list.sort(key=self.game_df_data_type)
-
-        # Perform the permutation  of unique values and store it in self.permutation_df for public access
-        # initializing the range with the Number of Dice rolled
-        # using list comprehension to formulate all distinct permutation s of the elements
-        perm_list = [list(face_permutation_list) for _ in range(len(self.game.dice))]
-
-        # using product() to get permutation s
-        self.permutation_list = list(product(*perm_list))
+    # Change the weight of a single side
+    def change_weight(self, face_value, new_weight):
+        """
+        PURPOSE:
+        Change the weight of a single side/face
 
-        # Construct the permutation  tuples indices
-        permutation_indices_list = [tuple([i] * len(self.permutation_list)) for i in range(len(self.permutation_list))]
+        INPUTS: Takes two arguments face value (int | str | float) to be changed and the new weight (int |
+        str | float)
 
-        # Construct the Index name
-        permutation_indices_name_list = ["roll_number " + str(index + 1) for index in range(len(self.permutation_list))]
+        OUTPUTS:
+        Assigns a dataframe with faces and the newly assigned weights (DataFrame(int | str | float))
+        """
+        # face passed must be valid
+        is_face_valid = (lambda face_values: face_values in self.faces)
+        if not is_face_valid(face_value):
+            return "Error:The face passed is invalid."
+        # Weight passed must be valid
+        is_weight_valid = isinstance(new_weight, float) | isinstance(new_weight, int) | isinstance(new_weight, bool)
+        if not is_weight_valid or new_weight < 0:
+            return "Error:The Weight passed is invalid."
+        self.weights[self.faces.index(face_value)] = new_weight
+        self._faces_weights_df = None
+        # The sampling structure no longer matches the weights
+        self._alias_table = None
+        self.version += 1
 
-        # Create Row Level MultiIndex
-        permutation_index = pd.MultiIndex.from_tuples(permutation_indices_list, names=permutation_indices_name_list)
+    # Roll the die one or more times
+    def roll_die(self, number_of_rolls=1, rng=None):
+        """
+        PURPOSE:
+        Roll the die one or more times honoring the face weights
 
-        # Create Column Level MultiIndex
-        cols = pd.MultiIndex.from_tuples(self.permutation_list)
+        INPUTS:
+        Takes one argument which is Number of rolls (int) and an optional np.random.Generator
 
-        # Create Data for the MultiIndex table
+        OUTPUTS:
+        Return a list of outcomes similar to the face types ([int | str | float]).
+        """
+        codes = self._roll_codes(number_of_rolls, np.random.default_rng() if rng is None else rng)
+        return np.array(self.faces, dtype=object)[codes].tolist()
+
+    def _roll_codes(self, number_of_rolls, rng, backend=None):
+        """
+        PURPOSE:
+        Draw weighted face indices in one vectorized call at constant cost per draw (Walker/Vose alias method)
+
+        INPUTS:
+        Takes the Number of rolls (int), a np.random.Generator and an optional backend (PythonBackend) turning the
+        draws into faces, picked by the number of rolls by default
+
+        OUTPUTS:
+        Returns the indices into the die faces (np.ndarray(int))
+        """
+        if self._alias_table is None:
+            self._alias_table = self._build_alias_table()
+        probability, alias = self._alias_table
+        columns = rng.integers(0, len(self.faces), size=number_of_rolls)
+        if alias is None:
+            # Every face has the same weight so the column drawn is the outcome
+            return columns
+        if backend is None:
+            backend = _select_backend('auto', number_of_rolls)
+        return backend.alias_codes(columns, rng.random(number_of_rolls), probability, alias)
+
+    def _is_fair(self):
+        """
+        PURPOSE:
+        Check whether every face of the die has the same weight
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns True when the die is fair, every weight being the same positive value (bool)
+        """
+        return bool(len(self.weights)) and bool(self.weights[0] > 0) and bool(np.all(self.weights == self.weights[0]))
+
+    def _build_alias_table(self):
+        """
+        PURPOSE:
+        Build the Vose alias table of the current weights
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the acceptance probability and alias of each face, the alias is None for a fair die
+        (np.ndarray(float), np.ndarray(int) | None)
+        """
+        total = self.weights.sum()
+        if total <= 0:
+            raise ValueError("The die weights must add up to a positive value.")
+        if self._is_fair():
+            return None, None
+        probability = self.weights * len(self.weights) / total
+        alias = np.arange(len(self.weights))
+        small = [index for index, value in enumerate(probability) if value < 1.0]
+        large = [index for index, value in enumerate(probability) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            alias[less] = more
+            probability[more] = probability[more] + probability[less] - 1.0
+            if probability[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left over is full up to rounding error
+        probability[small + large] = 1.0
+        return probability, alias
+
+    # Show the user the die’s current set of faces and weights
+    def show_state(self):
+        """
+        PURPOSE:
+        Show the die’s current set of faces and weights(could be changed by change_weight)
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the dataframe according to the face types (DataFrame(int | str | float)).
+        """
+        return self.faces_weights_df
+
+    @property
+    def faces_weights_df(self):
+        """
+        PURPOSE:
+        Build the dataframe containing faces and weights respectively on first use, and keep it until the weights
+        change
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the dataframe with faces and weights column (DataFrame(int | str | float))
+        """
+        if self._faces_weights_df is None:
+            self._faces_weights_df = pd.DataFrame(self.faces, columns=['faces']).assign(weights=self.weights)
+        return self._faces_weights_df
+
+
+class Deck:
+    """
+    PURPOSE:
+    A class to deal hands of cards without replacement, many hands at once, so the cards of a hand are never
+    repeated unless the deck holds several copies of them
+
+    ATTRIBUTES:
+    Takes a list of cards, repeated cards are copies of the same face
+
+    METHODS:
+    __init__:: Collect the distinct faces of the cards and the copies of each
+    deal:: Deal one or more hands of cards
+    show_state:: Display the faces and the copies of each in the deck
+    -------------------------------------------------------------------------
+    """
+
+    __slots__ = ('cards', 'faces', 'weights', 'version', 'card_codes')
+
+    def __init__(self, cards):
+        """
+        PURPOSE:
+        Initializes the cards, their distinct faces and the copies of each face
+
+        INPUTS:
+        Takes a List of cards ([int | str | float])
+
+        OUTPUTS:
+        Assigns the cards, the faces in order of first appearance, the face index of every card and the copies of
+        each face as its weight, so a Game of Deck cards reads like a Game of dice
+        """
+        self.cards = list(cards)
+        face_index = {}
+        for card in self.cards:
+            face_index.setdefault(card, len(face_index))
+        self.faces = list(face_index)
+        self.card_codes = np.array([face_index[card] for card in self.cards], dtype=np.int64)
+        self.weights = np.bincount(self.card_codes, minlength=len(self.faces)).astype(float)
+        # A deck is never reweighted, the version only mirrors the one of a Die
+        self.version = 0
+
+    # Deal one or more hands
+    def deal(self, number_of_hands=1, hand_size=5, rng=None):
+        """
+        PURPOSE:
+        Deal one or more hands from a freshly shuffled deck each
+
+        INPUTS:
+        Takes the Number of hands (int), the cards per hand (int) and an optional np.random.Generator
+
+        OUTPUTS:
+        Return one list of cards per hand ([[int | str | float]])
+        """
+        codes = self._deal_codes(number_of_hands, hand_size, np.random.default_rng() if rng is None else rng)
+        return np.array(self.faces, dtype=object)[codes].tolist()
+
+    def _deal_codes(self, number_of_hands, hand_size, rng):
+        """
+        PURPOSE:
+        Deal every hand at once with a partial Fisher–Yates shuffle vectorized over the hands. Only the positions
+        swapped so far hold another card than their own, so the shuffled deck is never materialized and a hand
+        costs O(hand size ** 2) vector operations whatever the size of the deck
+
+        INPUTS:
+        Takes the Number of hands (int), the cards per hand (int) and a np.random.Generator
+
+        OUTPUTS:
+        Returns the indices into the deck faces of shape hands by cards per hand (np.ndarray(int))
+        """
+        if hand_size > len(self.cards):
+            raise ValueError("The hand can not hold more cards than the deck.")
+        hands = np.empty((number_of_hands, hand_size), dtype=np.int64)
+        swapped_positions, swapped_cards = [], []
+        for slot in range(hand_size):
+            # Swap a card drawn from the rest of the deck into the slot
+            position = rng.integers(slot, len(self.cards), size=number_of_hands)
+            card = position.copy()
+            displaced = np.full(number_of_hands, slot)
+            # Replay the earlier swaps in order, the latest swap of a position wins
+            for swapped_position, swapped_card in zip(swapped_positions, swapped_cards):
+                np.copyto(card, swapped_card, where=position == swapped_position)
+                np.copyto(displaced, swapped_card, where=swapped_position == slot)
+            hands[:, slot] = card
+            swapped_positions.append(position)
+            swapped_cards.append(displaced)
+        return self.card_codes[hands]
+
+    # Show the user the deck’s faces and copies
+    def show_state(self):
+        """
+        PURPOSE:
+        Show the deck’s faces and the copies of each
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the dataframe with faces and copies column (DataFrame(int | str | float))
+        """
+        return pd.DataFrame(self.faces, columns=['faces']).assign(copies=self.weights.astype(np.int64))
+
+
+class Game:
+    """
+    PURPOSE:
+    A class to roll one or more dice of the same kind one or more times.
+    Inherits methods from Die class to perform the simulations
+
+    ATTRIBUTES:
+    Takes a list of similarly defined dice (Die Objects/instances), or the same Deck once per card of a hand to
+    deal the cards without replacement, every roll then being one hand.
+
+    METHODS:
+    __init__:: Instantiate a similar Die Objects.
+    play:: Rolls the Dice drawing the whole outcome matrix with a numpy Generator
+    show:: Display the results of the most recent play
+    -------------------------------------------------------------------------
+    """
+
+    def __init__(self, dice, seed=None, history_size=10, backend='auto'):
+        """
+        PURPOSE:
+        Initializes dice object which is inherited from the Die Class
+
+        INPUTS:
+        Takes one argument which is a List of Dice Objects ([int | str | float]), an optional seed
+        (int | np.random.SeedSequence | np.random.Generator) for reproducible plays, the number of dataframes
+        shown to keep in Game.play_result_df_list (int), 0 to keep none and None to keep them all, and the backend
+        running the sampling and analysis kernels (str), one of BACKENDS or 'auto' to pick one by the size of
+        every play. All the backends give identical results for the same seed
+
+        OUTPUTS:
+        Assigns internal dice variable for use in multiple areas (DataFrame(int | str | float))
+        """
+        # Take the list of dice
+        self.dice = dice
+        self.cols = []
+        self.columns = []
+        self.faces = []
+        self.codes = np.empty((0, len(dice)), dtype=np.uint8)
+        # Buffer the appended rolls are written to, Game.codes being a view of its front
+        self._codes_buffer = None
+        # The play dataframe is built on first use, so rolling without it does not need pandas
+        self._play_df = None
+        self.compact = False
+        # Counts the play dataframes assigned in place of the one built from the codes
+        self.play_df_version = 0
+        # True once a play dataframe was assigned, Game.codes then no longer describe it
+        self.codes_stale = False
+        self.number_of_rolls = 0
+        # Only the last history_size dataframes shown are kept alive, the oldest dropped first
+        self.history_size = history_size
+        self.play_result_df_list = deque(maxlen=history_size)
+        # Narrow form of the last play dataframe the Game built and showed narrow, keyed by its identity and version
+        self._narrow_view = None
+        # Variance reduction of the last play, the likelihood ratio of every roll is None for plain sampling
+        self.sampling = 'plain'
+        self.roll_weights = None
+        self.stratum_probabilities = None
+        # Counts the fresh plays, appended rolls keep the generation of the play they extend
+        self.generation = 0
+        # Phase timings, off unless instrument is called
+        self.stats = None
+        # A single generator draws every roll of the Game, whatever the backend
+        self.rng = np.random.default_rng(seed)
+        self.backend = backend
+
+    @property
+    def play_df(self):
+        """
+        PURPOSE:
+        Get the dataframe of the most recent play, an empty one being built on first use when there is none
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the play dataframe of shape N rolls by M dice (DataFrame(int | str | float))
+        """
+        if self._play_df is None:
+            self._play_df = self._build_play_df(self.codes, self.compact) if self.columns else pd.DataFrame()
+        return self._play_df
+
+    @play_df.setter
+    def play_df(self, play_df):
+        """
+        PURPOSE:
+        Replace the dataframe of the most recent play
+
+        INPUTS:
+        Takes the play dataframe (DataFrame(int | str | float))
+
+        OUTPUTS:
+        Assigns the play dataframe, a new result for the Analyzers of the Game, and marks Game.codes as stale
+        """
+        self._play_df = play_df
+        self.play_df_version += 1
+        self.codes_stale = True
+
+    # Record the time spent in every phase of the Game and its Analyzers
+    def instrument(self, hook=None):
+        """
+        PURPOSE:
+        Turn on the recording of the wall time, rolls and result bytes of every phase (sampling, dataframe, show,
+        melt, and the statistics of any Analyzer created from the Game afterwards)
+
+        INPUTS:
+        Takes an optional hook called after every phase with the phase name (str), the seconds (float), the rolls
+        (int) and the bytes of the result (int)
+
+        OUTPUTS:
+        Returns the recorded statistics, also kept as Game.stats (Stats)
+        """
+        self.stats = Stats(hook)
+        return self.stats
+
+    # Rolls the Dice
+    def play(self, number_of_rolls, compact=False, workers=None, sampling='plain', proposal=None, append=False):
+        """
+        PURPOSE:
+        Rolls the Dice drawing the whole N rolls by M dice outcome matrix at once
+
+        INPUTS:
+        Takes one parameter to specify how many times the dice should be rolled.(int) and an optional compact
+        flag (bool) to store the dataframe columns as pandas Categorical over the Game faces. An optional number
+        of worker processes (int) splits the rolls in blocks of PARALLEL_BLOCK_ROLLS, each drawn from its own
+        child SeedSequence, so the same seed gives the same result whatever the number of workers.
+        An optional variance reduction sampling (str): 'importance' draws from tilted proposal dice ([Die], by
+        default every roll loads all the dice half way onto one face) and keeps the likelihood ratio of every roll,
+        'stratified' spreads the rolls over the faces of the first die in proportion to its weights and
+        'antithetic' pairs every roll with the mirrored one. Use Analyzer.jackpot_estimate and
+        Analyzer.combo_estimate for the unbiased estimates with standard errors. An optional append flag (bool)
+        adds the rolls after the results of the previous plain play instead of replacing them, and an Analyzer
+        of the Game then only processes the new rolls
+
+        OUTPUTS: Saves the result of the play to a private dataframe of shape N rolls by M dice. (DataFrame(int |
+        str | float)). The integer coded result is also kept as Game.codes with the lookup table Game.faces, and
+        the likelihood ratio of every roll as Game.roll_weights
+        """
+        if sampling not in ('plain', 'importance', 'stratified', 'antithetic'):
+            return "Error:The sampling can only be 'plain', 'importance', 'stratified' or 'antithetic'."
+        if sampling != 'plain' and workers is not None:
+            return "Error:Variance reduction sampling can not be split across workers."
+        try:
+            _select_backend(self.backend, 0)
+        except ValueError as error:
+            return "Error:" + str(error)
+        if any(not die.weights.sum() > 0 for die in self.dice):
+            return "Error:The die weights must add up to a positive value."
+        if proposal is not None and (len(proposal) != len(self.dice) or any(
+                face not in self._game_faces() for die in proposal for face in die.faces)):
+            return "Error:The proposal must hold one die per die of the Game with faces of the Game."
+        if proposal is not None and not all(face in proposal_die.faces and
+                                            proposal_die.weights[proposal_die.faces.index(face)] > 0
+                                            for die, proposal_die in zip(self.dice, proposal)
+                                            for face, weight in zip(die.faces, die.weights) if weight > 0):
+            return "Error:The proposal must be able to roll every face the dice can roll."
+        if any(isinstance(die, Deck) for die in self.dice):
+            if any(die is not self.dice[0] for die in self.dice):
+                return "Error:The cards of a hand must all be dealt from the same Deck."
+            if len(self.dice) > len(self.dice[0].cards):
+                return "Error:The hand can not hold more cards than the deck."
+            if sampling != 'plain':
+                return "Error:Variance reduction sampling is not available for dealt hands."
+        if append and len(self.codes):
+            if sampling != 'plain' or self.sampling != 'plain':
+                return "Error:Only plain plays can be appended to."
+            if self.faces != self._game_faces():
+                return "Error:The dice faces changed since the play appended to."
+            if compact != self.compact:
+                return "Error:The rolls appended must be compact exactly when the play appended to is."
+            if self.codes_stale:
+                return "Error:The play dataframe was replaced since the play appended to."
+            return self._play_append(number_of_rolls, compact, workers)
+        # assign and make the Number of rolls accessible
+        self.number_of_rolls = number_of_rolls
+        self.generation += 1
+        self.play_result_df_list = deque(maxlen=self.history_size)
+        # Filter out the Die for M Column
+        self.columns = ["Die " + str(index + 1) for index, dice in enumerate(self.dice)]
+        # Build the face lookup table shared by every die of the Game
+        self.faces = self._game_faces()
+        self.cols = [str(face) for face in self.faces]
+
+        # Draw every outcome as a face code in a single call
+        self.sampling = sampling
+        self.roll_weights = None
+        self.stratum_probabilities = None
+        started = time.perf_counter() if self.stats is not None else None
+        if sampling != 'plain':
+            self.codes, self.roll_weights = self._roll_codes_variance_reduced(self.number_of_rolls, sampling,
+                                                                              proposal)
+        elif workers is None:
+            self.codes = self._roll_codes(self.number_of_rolls)
+        else:
+            self.codes = self._roll_codes_parallel(self.number_of_rolls, workers)
+        if self.stats is not None:
+            self.stats.record('sample', started, number_of_rolls, _nbytes(self.codes))
+            started = time.perf_counter()
+
+        # Create the play Dataframe once from the outcome matrix
+        self.compact = compact
+        self.codes_stale = False
+        self._play_df = self._build_play_df(self.codes, compact)
+        if self.stats is not None:
+            self.stats.record('dataframe', started, number_of_rolls, _nbytes(self._play_df))
+        return self._play_df
+
+    def _play_append(self, number_of_rolls, compact, workers):
+        """
+        PURPOSE:
+        Roll the dice again and add the rolls after the current results, numbering them on from the last roll
+
+        INPUTS:
+        Takes the number of rolls to add (int), the compact flag (bool) and the number of worker processes (int)
+
+        OUTPUTS:
+        Returns the dataframe of the rolls added, Game.codes, Game.play_df and Game.number_of_rolls cover every roll
+        so far (DataFrame(int | str | float))
+        """
+        started = time.perf_counter() if self.stats is not None else None
+        if workers is None:
+            new_codes = self._roll_codes(number_of_rolls)
+        else:
+            new_codes = self._roll_codes_parallel(number_of_rolls, workers)
+        if self.stats is not None:
+            self.stats.record('sample', started, number_of_rolls, _nbytes(new_codes))
+            started = time.perf_counter()
+        new_play_df = self._build_play_df(new_codes, compact, first_roll=len(self.codes) + 1)
+        self.codes, self._codes_buffer = _extend(self.codes, new_codes, self._codes_buffer)
+        # The whole play dataframe is only built again if it is asked for
+        self._play_df = None
+        if self.stats is not None:
+            self.stats.record('dataframe', started, number_of_rolls, _nbytes(new_play_df))
+        self.number_of_rolls = len(self.codes)
+        return new_play_df
+
+    # Rolls the Dice chunk by chunk
+    def play_stream(self, number_of_rolls, chunk_size=100000):
+        """
+        PURPOSE:
+        Rolls the Dice in fixed-size chunks without keeping the results, for plays too large for a dataframe
+
+        INPUTS:
+        Takes the number of times the dice should be rolled (int) and the number of rolls per chunk (int)
+
+        OUTPUTS:
+        Yields outcome matrices of shape chunk_size rolls by M dice of face codes into Game.faces (np.ndarray(uint)),
+        the last one holding the remaining rolls. Feed them to Analyzer.update to compute statistics as they go
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be a positive number of rolls.")
+        self.number_of_rolls = number_of_rolls
+        self.play_result_df_list = deque(maxlen=self.history_size)
+        self.columns = ["Die " + str(index + 1) for index, dice in enumerate(self.dice)]
+        self.faces = self._game_faces()
+        self.cols = [str(face) for face in self.faces]
+        # Streamed rolls are not kept so the previous result is dropped
+        self.sampling = 'plain'
+        self.roll_weights = None
+        self.stratum_probabilities = None
+        self.codes = np.empty((0, len(self.dice)), dtype=self._code_dtype())
+        self._play_df = None
+        self.compact = False
+        self.codes_stale = False
+        self.generation += 1
+
+        for first_roll in range(0, number_of_rolls, chunk_size):
+            started = time.perf_counter() if self.stats is not None else None
+            chunk = self._roll_codes(min(chunk_size, number_of_rolls - first_roll))
+            if self.stats is not None:
+                self.stats.record('sample', started, len(chunk), _nbytes(chunk))
+            yield chunk
+
+    # Rolls the Dice chunk by chunk, saving the progress to resume from
+    def play_checkpointed(self, number_of_rolls, checkpoint, analyzer=None, chunk_size=100000, checkpoint_every=10):
+        """
+        PURPOSE:
+        Rolls the Dice chunk by chunk into an Analyzer, saving the generator state, the rolls completed and the
+        running totals of the Analyzer every few chunks, so that a run that was interrupted resumes from its last
+        checkpoint and ends with exactly the result of an uninterrupted run
+
+        INPUTS:
+        Takes the number of times the dice should be rolled (int), the path of the checkpoint file (str), an optional
+        Analyzer of the Game to fold the chunks into (a new one by default), the number of rolls per chunk (int) and
+        the number of chunks between two checkpoints (int). An existing checkpoint file is resumed from
+
+        OUTPUTS:
+        Returns the Analyzer holding the statistics of every roll (Analyzer). The checkpoint file is left in place
+        """
+        if chunk_size < 1 or checkpoint_every < 1:
+            raise ValueError("The chunk size and the checkpoint interval must be positive numbers.")
+        if analyzer is None:
+            analyzer = Analyzer(self)
+        faces = _json_faces(self._game_faces())
+        # A resumed run must roll the same dice, weights included, or the totals would mix two distributions
+        dice = [{'faces': _json_faces(die.faces), 'weights': die.weights.tolist()} for die in self.dice]
+        rolls_completed = 0
+        if os.path.exists(checkpoint):
+            state = _load_checkpoint(checkpoint)
+            if state['number_of_rolls'] != number_of_rolls or state['chunk_size'] != chunk_size or \
+                    state['faces'] != faces or state.get('dice') != dice:
+                return "Error:The checkpoint was saved by a different play."
+            self.rng.bit_generator.state = state['rng']
+            analyzer._restore_stream_state(state['analyzer'])
+            rolls_completed = state['rolls_completed']
+
+        chunks_since_checkpoint = 0
+        for chunk in self.play_stream(number_of_rolls - rolls_completed, chunk_size):
+            analyzer.update(chunk)
+            rolls_completed += len(chunk)
+            chunks_since_checkpoint += 1
+            # The generator is paused before the next chunk, so its state is the one to resume from
+            if chunks_since_checkpoint == checkpoint_every or rolls_completed == number_of_rolls:
+                _save_checkpoint(checkpoint, {'number_of_rolls': number_of_rolls, 'chunk_size': chunk_size,
+                                              'faces': faces, 'dice': dice, 'rolls_completed': rolls_completed,
+                                              'rng': self.rng.bit_generator.state,
+                                              'analyzer': analyzer._stream_state()})
+                chunks_since_checkpoint = 0
+        # A run resumed with every roll already done streams no chunk, the restored totals still belong to this play
+        analyzer.stream_generation = self.generation
+        self.number_of_rolls = number_of_rolls
+        return analyzer
+
+    # Rolls the Dice straight into a file
+    def play_to_file(self, path, number_of_rolls, chunk_size=100000):
+        """
+        PURPOSE:
+        Rolls the Dice chunk by chunk into a memory-mapped file of face codes, for plays too large for memory or
+        meant to be analyzed again later or by other processes
+
+        INPUTS:
+        Takes the path of the .npy file to write (str), the number of times the dice should be rolled (int) and the
+        number of rolls per chunk (int)
+
+        OUTPUTS:
+        Writes the N rolls by M dice matrix of face codes into Game.faces to the .npy file, the faces, columns and
+        dice to the path + '.json' sidecar and the statistics of the rolls to the path + '.summary.npz' file, then
+        returns the path (str). Open it with Analyzer.from_file, which loads the statistics instead of reading the
+        rolls again. The matrix is kept row-major: every chunk of rolls is then one contiguous block, written and
+        read in a single sequential pass, where a column per die would scatter each chunk over M regions of the file
+        """
+        self.faces = self._game_faces()
+        store = np.lib.format.open_memmap(path, mode='w+', dtype=self._code_dtype(),
+                                          shape=(number_of_rolls, len(self.dice)))
+        # The rolls are folded into the statistics while they are at hand, so reopening the store does not scan it
+        analyzer = Analyzer(self)
+        first_roll = 0
+        for chunk in self.play_stream(number_of_rolls, chunk_size):
+            store[first_roll:first_roll + len(chunk)] = chunk
+            analyzer.update(chunk)
+            first_roll += len(chunk)
+        store.flush()
+        del store
+        _save_checkpoint(path + '.summary.npz', {'rolls': number_of_rolls, 'analyzer': analyzer._stream_state()})
+
+        metadata = {'rolls': number_of_rolls, 'faces': _json_faces(self.faces), 'columns': self.columns,
+                    'dice': [{'faces': _json_faces(die.faces), 'weights': die.weights.tolist()} for die in self.dice],
+                    'summary': os.path.basename(path) + '.summary.npz'}
+        with open(path + '.json', 'w') as sidecar:
+            json.dump(metadata, sidecar)
+        return path
+
+    # Rolls the Dice until the estimate is precise enough
+    def play_until(self, statistic='jackpot', target=None, precision=0.01, confidence=0.95, batch_size=10000,
+                   max_rolls=10000000, interval='wilson', analyzer=None):
+        """
+        PURPOSE:
+        Rolls the Dice in batches until the confidence interval of a statistic is narrow enough or the roll budget
+        is spent, instead of guessing the number of rolls up front
+
+        INPUTS:
+        Takes the statistic (str) 'jackpot' (rate of rolls with identical faces), 'face' (frequency of the target
+        face among all the dice rolled) or 'combo' (rate of rolls showing the target faces in any order), the target
+        face (int | str | float) or combination ([int | str | float]), the precision as the largest half width of
+        the interval (float), the confidence level (float), the rolls per batch (int), the roll budget (int), the
+        interval method 'wilson' or 'normal' (str) and an optional Analyzer updated with every batch
+
+        OUTPUTS:
+        Returns the estimate with its interval, the successes and trials counted, the rolls used and whether the
+        precision was reached (Series). The rolls used are also saved as Game.number_of_rolls
+        """
+        if statistic not in ('jackpot', 'face', 'combo'):
+            return "Error:The statistic can only be 'jackpot', 'face' or 'combo'."
+        if interval not in ('wilson', 'normal'):
+            return "Error:The interval can only be 'wilson' or 'normal'."
+        faces = self._game_faces()
+        if statistic == 'face' and target not in faces:
+            return "Error:The face passed is invalid."
+        if statistic == 'combo' and (target is None or len(target) != len(self.dice)
+                                     or any(face not in faces for face in target)):
+            return "Error:The combination passed is invalid."
+        target_codes = np.sort([faces.index(face) for face in target]) if statistic == 'combo' else None
+
+        successes, trials, rolls = 0, 0, 0
+        estimate, lower, upper = 0.0, 0.0, 1.0
+        for chunk in self.play_stream(max_rolls, batch_size):
+            if analyzer is not None:
+                analyzer.update(chunk)
+            rolls += len(chunk)
+            if statistic == 'jackpot':
+                successes += int((chunk == chunk[:, :1]).all(axis=1).sum())
+                trials += len(chunk)
+            elif statistic == 'face':
+                successes += int((chunk == faces.index(target)).sum())
+                trials += chunk.size
+            else:
+                successes += int((np.sort(chunk, axis=1) == target_codes).all(axis=1).sum())
+                trials += len(chunk)
+            estimate, lower, upper = _confidence_interval(successes, trials, confidence, interval)
+            # A normal interval is degenerate until both outcomes have been seen
+            if (upper - lower) / 2 <= precision and (interval == 'wilson' or 0 < successes < trials):
+                break
+        self.number_of_rolls = rolls
+
+        return pd.Series({'estimate': estimate, 'lower': lower, 'upper': upper, 'half width': (upper - lower) / 2,
+                          'successes': successes, 'trials': trials, 'rolls': rolls,
+                          'precision reached': (upper - lower) / 2 <= precision}, dtype=object)
+
+    # Rolls many weight configurations of the Dice at once
+    def sweep(self, scenarios, number_of_rolls, top_combos=3):
+        """
+        PURPOSE:
+        Rolls many scenarios of the Game in one vectorized run, every scenario reusing the same uniform draws so
+        the differences between scenarios are not blurred by sampling noise
+
+        INPUTS:
+        Takes the scenarios as a dict (or list) of weight vectors over the Game faces applied to every die,
+        M dice by F faces weight matrices, or lists of Die Objects with the faces of the Game, the number of rolls
+        per scenario (int) and the number of most frequent combinations to report (int)
+
+        OUTPUTS:
+        Returns one row per scenario with the relative frequency of every face, the jackpot count and rate and the
+        most frequent combinations with their relative frequencies (DataFrame)
+        """
+        if any(isinstance(die, Deck) for die in self.dice):
+            return "Error:Scenarios can only be swept for dice."
+        faces = self._game_faces()
+        if not isinstance(scenarios, dict):
+            scenarios = dict(enumerate(scenarios))
+        probabilities = []
+        for scenario in scenarios.values():
+            if len(scenario) and all(isinstance(die, Die) for die in scenario):
+                if len(scenario) != len(self.dice) or any(face not in faces for die in scenario for face in die.faces):
+                    return "Error:The scenario dice must be as many as the Game dice with faces of the Game."
+                probabilities.append(_face_probabilities(scenario, faces))
+                continue
+            is_shape_valid = np.ndim(scenario) in (1, 2) and np.shape(scenario)[-1] == len(faces) and \
+                (np.ndim(scenario) == 1 or len(scenario) == len(self.dice))
+            weights = np.broadcast_to(np.asarray(scenario, dtype=float), (len(self.dice), len(faces))) \
+                if is_shape_valid else None
+            if weights is None or np.any(weights < 0) or np.any(weights.sum(axis=1) <= 0):
+                return "Error:The scenario weights must be non-negative with one weight per face of the Game."
+            probabilities.append(weights / weights.sum(axis=1, keepdims=True))
+        probabilities = np.array(probabilities).reshape(len(scenarios), len(self.dice), len(faces))
+
+        # Scenarios x rolls x dice outcome tensor, all the scenarios sharing the same uniforms
+        started = time.perf_counter() if self.stats is not None else None
+        uniforms = self.rng.random((number_of_rolls, len(self.dice)))
+        code_dtype = np.uint8 if len(faces) <= 256 else np.uint16 if len(faces) <= 65536 else np.uint32
+        codes = np.empty((len(scenarios), number_of_rolls, len(self.dice)), dtype=code_dtype)
+        for scenario in range(len(scenarios)):
+            for position in range(len(self.dice)):
+                codes[scenario, :, position] = _inverse_cdf(probabilities[scenario, position], uniforms[:, position])
+
+        offsets = np.arange(len(scenarios), dtype=np.int64)[:, None, None] * len(faces)
+        face_totals = np.bincount((codes + offsets).ravel(),
+                                  minlength=len(scenarios) * len(faces)).reshape(len(scenarios), len(faces))
+        summary = pd.DataFrame(face_totals / max(number_of_rolls * len(self.dice), 1),
+                               index=pd.Index(list(scenarios), name='scenario'), columns=[str(face) for face in faces])
+        jackpots = (codes == codes[:, :, :1]).all(axis=2).sum(axis=1)
+        summary['jackpot'] = jackpots
+        summary['jackpot rate'] = jackpots / max(number_of_rolls, 1)
+
+        # Combinations are counted on mixed-radix keys of the sorted rows when they fit in int64
+        face_values = np.array(faces, dtype=object)
+        sorted_codes = np.sort(codes, axis=2)
+        fits = len(self.dice) * np.log2(max(len(faces), 2)) < 62
+        radix = len(faces) ** np.arange(len(self.dice) - 1, -1, -1, dtype=np.int64) if fits else None
+        frequent = []
+        for scenario_codes in sorted_codes:
+            if fits:
+                _, first, counts = np.unique(scenario_codes @ radix, return_index=True, return_counts=True)
+                combinations = scenario_codes[first]
+            else:
+                combinations, counts = np.unique(scenario_codes, axis=0, return_counts=True)
+            most_frequent = np.argsort(-counts, kind='stable')[:top_combos]
+            frequent.append([(tuple(face_values[combinations[index]].tolist()), counts[index] / number_of_rolls)
+                             for index in most_frequent])
+        summary['top combos'] = frequent
+        if self.stats is not None:
+            self.stats.record('sweep', started, len(scenarios) * number_of_rolls, _nbytes(codes))
+        return summary
+
+    def _game_faces(self):
+        """
+        PURPOSE:
+        Collect the faces of the dice into the Game face lookup table
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the faces of the last die followed by any face only found on the other dice ([int | str | float])
+        """
+        if not self.dice:
+            return []
+        faces = list(self.dice[-1].faces)
+        seen = set(faces)
+        for die in self.dice:
+            for face in die.faces:
+                if face not in seen:
+                    seen.add(face)
+                    faces.append(face)
+        return faces
+
+    def _roll_codes(self, number_of_rolls):
+        """
+        PURPOSE:
+        Roll every die number_of_rolls times as indices into the Game face lookup table
+
+        INPUTS:
+        Takes one parameter to specify how many times the dice should be rolled.(int)
+
+        OUTPUTS:
+        Returns the outcome matrix of shape N rolls by M dice in the smallest code type (np.ndarray(uint))
+        """
+        code_dtype = self._code_dtype()
+        backend = _select_backend(self.backend, number_of_rolls * len(self.dice))
+        face_counts = np.array([len(die.faces) for die in self.dice], dtype=np.int64)
+        if any(isinstance(die, Deck) for die in self.dice):
+            if any(die is not self.dice[0] for die in self.dice):
+                raise ValueError("The cards of a hand must all be dealt from the same Deck.")
+            # Every roll is one hand, the cards of a hand drawn without replacement
+            codes = self.dice[0]._deal_codes(number_of_rolls, len(self.dice), self.rng).astype(code_dtype)
+        elif len(set(face_counts.tolist())) == 1 and all(die._is_fair() for die in self.dice):
+            # Fair dice alike in size are drawn in a single call over the whole matrix
+            codes = self.rng.integers(0, face_counts[0], size=(number_of_rolls, len(self.dice)), dtype=code_dtype)
+        else:
+            codes = np.empty((number_of_rolls, len(self.dice)), dtype=code_dtype)
+            for position, die in enumerate(self.dice):
+                codes[:, position] = die._roll_codes(number_of_rolls, self.rng, backend)
+        # Translate each die's own face index into the Game face index
+        face_index = {face: index for index, face in enumerate(self.faces)}
+        for position, die in enumerate(self.dice):
+            lookup = np.array([face_index[face] for face in die.faces], dtype=code_dtype)
+            if not np.array_equal(lookup, np.arange(len(lookup))):
+                codes[:, position] = lookup[codes[:, position]]
+        return codes
+
+    def _roll_codes_parallel(self, number_of_rolls, workers):
+        """
+        PURPOSE:
+        Roll the dice across a pool of worker processes, each block of rolls with an independent random stream
+
+        INPUTS:
+        Takes the number of times the dice should be rolled (int) and the number of worker processes (int)
+
+        OUTPUTS:
+        Returns the outcome matrix of shape N rolls by M dice in roll order (np.ndarray(uint))
+        """
+        from multiprocessing import shared_memory
+
+        shape = (number_of_rolls, len(self.dice))
+        code_dtype = self._code_dtype()
+        # The child seeds only depend on the Game generator so a seeded Game replays the same blocks
+        block_seeds = np.random.SeedSequence(self.rng.integers(0, 2 ** 32, size=4).tolist()).spawn(
+            -(-number_of_rolls // PARALLEL_BLOCK_ROLLS))
+        first_rolls = range(0, number_of_rolls, PARALLEL_BLOCK_ROLLS)
+        blocks = [(first_roll, min(PARALLEL_BLOCK_ROLLS, number_of_rolls - first_roll), seed)
+                  for first_roll, seed in zip(first_rolls, block_seeds)]
+        if workers <= 1 or len(blocks) <= 1:
+            codes = np.empty(shape, dtype=code_dtype)
+            for first_roll, block_rolls, seed in blocks:
+                codes[first_roll:first_roll + block_rolls] = _roll_block(self.dice, self.faces, block_rolls, seed,
+                                                                           self.backend)
+            return codes
+
+        # Workers write their blocks straight into shared memory instead of sending results back
+        shared_size = max(number_of_rolls * len(self.dice) * np.dtype(code_dtype).itemsize, 1)
+        shared = shared_memory.SharedMemory(create=True, size=shared_size)
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(blocks)), initializer=_init_play_worker,
+                                     initargs=(self.dice, self.faces, shared.name, shape, code_dtype,
+                                               self.backend)) as pool:
+                list(pool.map(_play_block, blocks))
+            codes = np.ndarray(shape, dtype=code_dtype, buffer=shared.buf).copy()
+        finally:
+            shared.close()
+            shared.unlink()
+        return codes
+
+    def _roll_codes_variance_reduced(self, number_of_rolls, sampling, proposal=None):
+        """
+        PURPOSE:
+        Roll the dice with importance, stratified or antithetic sampling
+
+        INPUTS:
+        Takes the number of times the dice should be rolled (int), the sampling (str) and the importance proposal
+        dice ([Die] | None)
+
+        OUTPUTS:
+        Returns the outcome matrix of shape N rolls by M dice (np.ndarray(uint)) and the likelihood ratio of every
+        roll (np.ndarray(float))
+        """
+        probabilities = _face_probabilities(self.dice, self.faces)
+        number_of_dice = len(self.dice)
+        codes = np.empty((number_of_rolls, number_of_dice), dtype=self._code_dtype())
+
+        if sampling == 'importance':
+            if proposal is None:
+                # Each mixture component loads every die half way onto a face all the dice can show
+                targets = np.flatnonzero((probabilities > 0).all(axis=0))
+                components = 0.5 * probabilities[None, :, :] + 0.5 * np.eye(len(self.faces))[targets][:, None, :]
+                if not len(components):
+                    components = probabilities[None]
+            else:
+                components = _face_probabilities(proposal, self.faces)[None]
+            chosen = self.rng.integers(0, len(components), size=number_of_rolls)
+            uniforms = self.rng.random((number_of_rolls, number_of_dice))
+            for component in range(len(components)):
+                rows = np.flatnonzero(chosen == component)
+                for position in range(number_of_dice):
+                    codes[rows, position] = _inverse_cdf(components[component, position], uniforms[rows, position])
+            # Likelihood ratio of the dice over the equally weighted mixture of the proposals
+            dice_positions = np.arange(number_of_dice)[None, :]
+            target_density = probabilities[dice_positions, codes].prod(axis=1)
+            proposal_density = np.zeros(number_of_rolls)
+            for component_probabilities in components:
+                proposal_density += component_probabilities[dice_positions, codes].prod(axis=1)
+            return codes, target_density / (proposal_density / len(components))
+
+        if sampling == 'stratified':
+            # Proportional allocation over the faces of the first die, at least two rolls per face when possible
+            strata = np.flatnonzero(probabilities[0])
+            self.stratum_probabilities = probabilities[0]
+            stratum_probabilities = probabilities[0, strata] / probabilities[0, strata].sum()
+            minimum_rolls = min(2, number_of_rolls // len(strata))
+            exact = stratum_probabilities * (number_of_rolls - minimum_rolls * len(strata))
+            allocation = minimum_rolls + np.floor(exact).astype(np.int64)
+            leftover = number_of_rolls - allocation.sum()
+            allocation[np.argsort(np.floor(exact) - exact)[:leftover]] += 1
+            codes[:, 0] = np.repeat(strata, allocation)
+            for position in range(1, number_of_dice):
+                codes[:, position] = _inverse_cdf(probabilities[position], self.rng.random(number_of_rolls))
+            stratum_weights = np.divide(stratum_probabilities * number_of_rolls, allocation,
+                                        out=np.zeros(len(strata)), where=allocation > 0)
+            weights = np.repeat(stratum_weights, allocation)
+            shuffled = self.rng.permutation(number_of_rolls)
+            return codes[shuffled], weights[shuffled]
+
+        # Antithetic pairs mirror the uniforms of every die, rolls 2k and 2k + 1 forming a pair
+        pairs = -(-number_of_rolls // 2)
+        uniforms = self.rng.random((pairs, number_of_dice))
+        uniforms = np.stack([uniforms, 1.0 - uniforms], axis=1).reshape(2 * pairs, number_of_dice)[:number_of_rolls]
+        for position in range(number_of_dice):
+            codes[:, position] = _inverse_cdf(probabilities[position], uniforms[:, position])
+        return codes, np.ones(number_of_rolls)
+
+    def _code_dtype(self):
+        """
+        PURPOSE:
+        Pick the smallest unsigned integer type able to hold a code for every Game face
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the numpy code type (np.uint8 | np.uint16 | np.uint32)
+        """
+        if len(self.faces) <= np.iinfo(np.uint8).max + 1:
+            return np.uint8
+        if len(self.faces) <= np.iinfo(np.uint16).max + 1:
+            return np.uint16
+        return np.uint32
+
+    def _build_play_df(self, codes, compact=False, first_roll=1):
+        """
+        PURPOSE:
+        Build the play dataframe from an outcome matrix of face codes
+
+        INPUTS:
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint)), the compact flag (bool) and the
+        number of the first roll (int)
+
+        OUTPUTS:
+        Returns the play dataframe indexed by roll number, Categorical columns when compact (DataFrame(int | str |
+        float))
+        """
+        index = pd.RangeIndex(first_roll, first_roll + len(codes), name='roll number')
+        if compact:
+            # Categorical columns keep the one byte codes and share the Game faces as categories
+            categories = pd.Index(self.faces, dtype=object if not self.faces else None)
+            return pd.DataFrame({column: pd.Categorical.from_codes(codes[:, position], categories=categories)
+                                 for position, column in enumerate(self.columns)},
+                                index=index, columns=self.columns)
+        # Every die shares the Game face table, so a single take keeps one dtype for all the columns
+        face_values = pd.Series(self.faces, dtype=object if not self.faces else None).to_numpy()
+        return pd.DataFrame(face_values[codes], index=index, columns=self.columns)
+
+    # Display the Dice results
+    # Default df return form is Wide = 1 and Narrow option is 2
+    def show(self, play_result_df, df_form=1):
+        """
+        PURPOSE:
+        Show the results of the most recent play.
+
+        INPUTS: Takes two arguments the play dataframe (DataFrame(int | str | float)) and df_form (int) that
+        means the default Wide = 1 and Narrow option is 2 as parameters
+
+        OUTPUTS: Display the result of the play result as a dataframe of shape N rolls by M dice.(DataFrame(int |
+        str | float))
+        """
+        if df_form != 1 and df_form != 2:
+            return print("Error:The dataframe display format option can only be Wide(value 1) or Narrow(value 2).")
+
+        started = time.perf_counter() if self.stats is not None else None
+        if self.play_result_df_list.maxlen != self.history_size:
+            self.play_result_df_list = deque(self.play_result_df_list, maxlen=self.history_size)
+        self.play_result_df_list.append(play_result_df)
+        if self.history_size == 0:
+            self._narrow_view = None
+
+        if df_form == 1:
+            if self.stats is not None:
+                self.stats.record('show', started, len(play_result_df))
+            return play_result_df
+        else:
+            # Only the narrow view of the play built by the Game is cached, a dataframe passed in may change in place
+            key = (play_result_df, self.generation, self.play_df_version, len(self.codes))
+            if self._narrow_view is not None and self._is_current_play(play_result_df) and \
+                    self._narrow_view[0][0] is key[0] and self._narrow_view[0][1:] == key[1:]:
+                narrow_df = self._narrow_view[1]
+            else:
+                narrow_df = self._narrow_df(play_result_df)
+                # The cached view keeps its dataframe alive, so it is not kept when no history is
+                if self.history_size != 0 and self._is_current_play(play_result_df):
+                    self._narrow_view = (key, narrow_df)
+            if self.stats is not None:
+                self.stats.record('melt', started, len(play_result_df), _nbytes(narrow_df))
+            return narrow_df
+
+    def _is_current_play(self, play_result_df):
+        """
+        PURPOSE:
+        Tell whether a dataframe is the play dataframe the Game built from its current codes
+
+        INPUTS:
+        Takes the play dataframe (DataFrame(int | str | float))
+
+        OUTPUTS:
+        Returns True when Game.codes describe the dataframe (bool)
+        """
+        return play_result_df is self._play_df and not self.codes_stale and len(self.codes) == len(play_result_df)
+
+    def _narrow_df(self, play_result_df):
+        """
+        PURPOSE:
+        Build the narrow form of a play dataframe, one row per roll and die, in the order of pd.melt
+
+        INPUTS:
+        Takes the play dataframe (DataFrame(int | str | float))
+
+        OUTPUTS:
+        Returns the dataframe indexed by roll number with the die number (Categorical over the dataframe columns)
+        and the face rolled, read straight from the outcome matrix when the dataframe is the current play
+        (DataFrame(int | str | float))
+        """
+        if not self._is_current_play(play_result_df):
+            narrow_df = pd.melt(play_result_df, value_vars=list(play_result_df.columns), var_name='die number',
+                                value_name='face rolled', ignore_index=False)
+            narrow_df['die number'] = pd.Categorical(narrow_df['die number'], categories=list(play_result_df.columns))
+            return narrow_df
+        # Die by die, the faces rolled are the columns of the outcome matrix one after the other
+        number_of_rolls, number_of_dice = self.codes.shape
+        face_values = pd.Series(self.faces, dtype=object if not self.faces else None).to_numpy()
+        die_codes = np.repeat(np.arange(number_of_dice, dtype=self._code_dtype()), number_of_rolls)
+        return pd.DataFrame({'die number': pd.Categorical.from_codes(die_codes, categories=self.columns),
+                             'face rolled': face_values[self.codes.T.ravel()]},
+                            index=play_result_df.index[np.tile(np.arange(number_of_rolls), number_of_dice)])
+
+
+def _json_faces(faces):
+    """
+    PURPOSE:
+    Convert faces to plain Python values that can be written to JSON
+
+    INPUTS:
+    Takes a list of faces ([int | str | float])
+
+    OUTPUTS:
+    Returns the faces with numpy scalars turned into Python ones ([int | str | float])
+    """
+    return [face.item() if isinstance(face, np.generic) else face for face in faces]
+
+
+def _save_checkpoint(path, state):
+    """
+    PURPOSE:
+    Write a checkpoint of a play to a compressed .npz file, replacing the previous one only once it is complete
+
+    INPUTS:
+    Takes the path of the checkpoint file (str) and the state with its 'analyzer' dict of arrays (dict)
+
+    OUTPUTS:
+    Writes the checkpoint file
+    """
+    arrays = {name: np.asarray(value) for name, value in state['analyzer'].items()}
+    metadata = {name: value for name, value in state.items() if name != 'analyzer'}
+    with open(path + '.tmp', 'wb') as checkpoint_file:
+        np.savez_compressed(checkpoint_file, metadata=np.array(json.dumps(metadata)), **arrays)
+    os.replace(path + '.tmp', path)
+
+
+def _load_checkpoint(path):
+    """
+    PURPOSE:
+    Read a checkpoint written by _save_checkpoint
+
+    INPUTS:
+    Takes the path of the checkpoint file (str)
+
+    OUTPUTS:
+    Returns the state with its 'analyzer' dict of arrays (dict)
+    """
+    with np.load(path) as checkpoint_file:
+        state = json.loads(str(checkpoint_file['metadata']))
+        state['analyzer'] = {name: checkpoint_file[name] for name in checkpoint_file.files if name != 'metadata'}
+    return state
+
+
+def _face_probabilities(dice, faces):
+    """
+    PURPOSE:
+    Normalize the weights of every die into probabilities over a face lookup table
+
+    INPUTS:
+    Takes the dice ([Die]) and the face lookup table ([int | str | float])
+
+    OUTPUTS:
+    Returns the M dice by F faces probability matrix (np.ndarray(float))
+    """
+    face_index = {face: index for index, face in enumerate(faces)}
+    probabilities = np.zeros((len(dice), len(faces)))
+    for position, die in enumerate(dice):
+        probabilities[position, [face_index[face] for face in die.faces]] = die.weights / die.weights.sum()
+    return probabilities
+
+
+def _inverse_cdf(probabilities, uniforms):
+    """
+    PURPOSE:
+    Turn uniform draws into face codes by inverting the cumulative face probabilities
+
+    INPUTS:
+    Takes the face probabilities (np.ndarray(float)) and the uniforms in [0, 1] (np.ndarray(float))
+
+    OUTPUTS:
+    Returns the face codes (np.ndarray(int))
+    """
+    cumulative = np.cumsum(probabilities)
+    # Rounding can never push a draw past the last face that can be rolled
+    return np.minimum(np.searchsorted(cumulative / cumulative[-1], uniforms, side='right'),
+                      np.flatnonzero(probabilities)[-1])
+
+
+def _confidence_interval(successes, trials, confidence, interval='wilson'):
+    """
+    PURPOSE:
+    Estimate a proportion with its Wilson score or normal approximation confidence interval
+
+    INPUTS:
+    Takes the number of successes (int), the number of trials (int), the confidence level (float) and the interval
+    method 'wilson' or 'normal' (str)
+
+    OUTPUTS:
+    Returns the estimate, the lower and the upper bound of the interval (float, float, float)
+    """
+    if trials == 0:
+        return 0.0, 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    estimate = successes / trials
+    if interval == 'normal':
+        half_width = z * np.sqrt(estimate * (1 - estimate) / trials)
+        return estimate, max(estimate - half_width, 0.0), min(estimate + half_width, 1.0)
+    center = (estimate + z ** 2 / (2 * trials)) / (1 + z ** 2 / trials)
+    half_width = z / (1 + z ** 2 / trials) * np.sqrt(estimate * (1 - estimate) / trials + z ** 2 / (4 * trials ** 2))
+    return estimate, max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+def _roll_block(dice, faces, number_of_rolls, seed, backend='auto'):
+    """
+    PURPOSE:
+    Roll one block of a parallel play with its own random stream
+
+    INPUTS:
+    Takes the dice ([Die]), the Game faces ([int | str | float]), the number of rolls (int), the block seed
+    (np.random.SeedSequence) and the backend name (str)
+
+    OUTPUTS:
+    Returns the outcome matrix of the block (np.ndarray(uint))
+    """
+    block_game = Game(dice, seed=seed, backend=backend)
+    block_game.faces = faces
+    return block_game._roll_codes(number_of_rolls)
+
+
+def _init_play_worker(dice, faces, shared_name, shape, code_dtype, backend='auto'):
+    """
+    PURPOSE:
+    Attach a parallel play worker process to the dice and the shared result matrix once
+
+    INPUTS:
+    Takes the dice ([Die]), the Game faces ([int | str | float]), the shared memory name (str), the result shape
+    ((int, int)), the face code type (np.dtype) and the backend name (str)
+
+    OUTPUTS:
+    Assigns the worker state
+    """
+    from multiprocessing import shared_memory
+
+    shared = shared_memory.SharedMemory(name=shared_name)
+    _worker_state.update(dice=dice, faces=faces, backend=backend, shared=shared,
+                         codes=np.ndarray(shape, dtype=code_dtype, buffer=shared.buf))
+
+
+def _play_block(block):
+    """
+    PURPOSE:
+    Roll one block of a parallel play into its rows of the shared result matrix
+
+    INPUTS:
+    Takes the first roll (int), the number of rolls (int) and the seed (np.random.SeedSequence) of the block
+
+    OUTPUTS:
+    Writes the block rolls in place and returns the number of rolls written (int)
+    """
+    first_roll, block_rolls, seed = block
+    _worker_state['codes'][first_roll:first_roll + block_rolls] = _roll_block(
+        _worker_state['dice'], _worker_state['faces'], block_rolls, seed, _worker_state['backend'])
+    return block_rolls
+
+
+def _extend(array, rows, buffer):
+    """
+    PURPOSE:
+    Append rows to an array kept at the front of a larger buffer, the buffer doubling when full, so that repeated
+    appends cost the rows appended rather than the whole array
+
+    INPUTS:
+    Takes the array and the rows to append along its first axis (np.ndarray, np.ndarray) and the buffer a previous
+    call returned for the array (np.ndarray | None). Only that buffer is written past the end of the array, any
+    other array is copied into a new buffer first
+
+    OUTPUTS:
+    Returns the extended array as a view of the front of its buffer and the buffer (np.ndarray, np.ndarray)
+    """
+    total = len(array) + len(rows)
+    is_buffer_front = buffer is not None and array.base is buffer and buffer.ctypes.data == array.ctypes.data \
+        and len(buffer) >= total
+    if not is_buffer_front:
+        buffer = np.empty((max(total, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+        buffer[:len(array)] = array
+    buffer[len(array):total] = rows
+    return buffer[:total], buffer
+
+
+def _nbytes(value):
+    """
+    PURPOSE:
+    Approximate the memory held by a result
+
+    INPUTS:
+    Takes a result (DataFrame | Series | np.ndarray | list | Summary | int | float)
+
+    OUTPUTS:
+    Returns its size in bytes (int)
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return 8 * len(value)
+    if isinstance(value, Summary):
+        return sum(_nbytes(result) for result in vars(value).values() if result is not None)
+    return 8
+
+
+class Stats:
+    """
+    PURPOSE:
+    A class to record where the time of a Game and its Analyzers goes, phase by phase
+
+    ATTRIBUTES:
+    phases:: Calls, seconds, rolls and largest result bytes of every phase by name (dict)
+    cache_hits, cache_misses:: How many Analyzer statistics were served from the cache or computed (int)
+    peak_bytes:: Largest result structure built by any phase (int)
+    hook:: Optional function called after every phase
+
+    METHODS:
+    __init__:: Start with nothing recorded
+    record:: Add one run of a phase
+    to_frame:: Tabulate the phases with their rolls per second
+    -------------------------------------------------------------------------
+    """
+
+    def __init__(self, hook=None):
+        """
+        PURPOSE:
+        Initializes empty statistics
+
+        INPUTS:
+        Takes an optional hook called with the phase name (str), the seconds (float), the rolls (int) and the bytes of
+        the result (int) after every phase
+
+        OUTPUTS:
+        Assigns empty phases and zero cache counts
+        """
+        self.phases = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.peak_bytes = 0
+        self.hook = hook
+
+    def record(self, phase, started, rolls=0, result_bytes=0):
+        """
+        PURPOSE:
+        Add one run of a phase that began at started
+
+        INPUTS:
+        Takes the phase name (str), the time.perf_counter value when it began (float), the rolls it went through
+        (int) and the bytes of the result it built (int)
+
+        OUTPUTS:
+        Updates the phase totals and calls the hook
+        """
+        seconds = time.perf_counter() - started
+        totals = self.phases.setdefault(phase, {'calls': 0, 'seconds': 0.0, 'rolls': 0, 'peak bytes': 0})
+        totals['calls'] += 1
+        totals['seconds'] += seconds
+        totals['rolls'] += rolls
+        totals['peak bytes'] = max(totals['peak bytes'], result_bytes)
+        self.peak_bytes = max(self.peak_bytes, result_bytes)
+        if self.hook is not None:
+            self.hook(phase, seconds, rolls, result_bytes)
+
+    def to_frame(self):
+        """
+        PURPOSE:
+        Tabulate the recorded phases, a phase calling another one includes its time
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns one row per phase with the calls, seconds, rolls, rolls per second and peak bytes (DataFrame)
+        """
+        phases_df = pd.DataFrame.from_dict(self.phases, orient='index',
+                                           columns=['calls', 'seconds', 'rolls', 'peak bytes'])
+        phases_df.index.name = 'phase'
+        phases_df.insert(3, 'rolls per second', phases_df['rolls'] / phases_df['seconds'].where(
+            phases_df['seconds'] > 0))
+        return phases_df
+
+
+class _KeyCounter:
+    """
+    PURPOSE:
+    A running count of rows of face codes grouped by their roll key, merged chunk after chunk
+
+    ATTRIBUTES:
+    keys, rows and counts of the distinct rolls seen so far, sorted by key, and the number of rolls counted
+
+    METHODS:
+    __init__:: Start with no rolls counted
+    add:: Fold distinct keys with their representative rows and counts into the running count
+    -------------------------------------------------------------------------
+    """
+
+    def __init__(self, number_of_dice, code_dtype=np.uint8):
+        """
+        PURPOSE:
+        Initializes an empty running count
+
+        INPUTS:
+        Takes the number of dice (int) and the face code type of the rows (np.dtype)
+
+        OUTPUTS:
+        Assigns empty keys, rows and counts
+        """
+        self.keys = np.empty(0, dtype=np.int64)
+        self.rows = np.empty((0, number_of_dice), dtype=code_dtype)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.rolls = 0
+
+    def add(self, keys, rows, counts):
+        """
+        PURPOSE:
+        Fold distinct keys with their representative rows and counts into the running count
+
+        INPUTS:
+        Takes the distinct keys in sorted order (np.ndarray(int)), one row of face codes per key (np.ndarray(uint))
+        and the counts (np.ndarray(int))
+
+        OUTPUTS:
+        Updates the keys, rows and counts in place
+        """
+        # Keys already counted only add to their count, the others are inserted in key order
+        positions = np.searchsorted(self.keys, keys)
+        is_known = positions < len(self.keys)
+        is_known[is_known] = self.keys[positions[is_known]] == keys[is_known]
+        np.add.at(self.counts, positions[is_known], counts[is_known])
+        is_new = ~is_known
+        self.keys = np.insert(self.keys, positions[is_new], keys[is_new])
+        self.rows = np.insert(self.rows, positions[is_new], rows[is_new].astype(self.rows.dtype), axis=0)
+        self.counts = np.insert(self.counts, positions[is_new], counts[is_new])
+        self.rolls += int(counts.sum())
+
+
+class Summary:
+    """
+    PURPOSE:
+    The statistics of a game result computed together in one pass by Analyzer.summary
+
+    ATTRIBUTES:
+    rolls:: Number of rolls analyzed (int)
+    face_counts:: How many times each face was rolled in each roll, None for streamed rolls (DataFrame(uint))
+    face_totals:: How many times each face was rolled over the whole game (Series(int))
+    jackpots:: How many rolls resulted in all faces being identical (int)
+    jackpot_rolls:: Roll numbers of the jackpots, None for streamed rolls (Index)
+    jackpot_faces:: How many jackpots each face hit (Series(int))
+    combinations:: Count of each combination rolled, order not mattering (DataFrame(int))
+    permutations:: Count of each sequence rolled (DataFrame(int))
+
+    METHODS:
+    __init__:: Assigns the statistics
+    -------------------------------------------------------------------------
+    """
+
+    def __init__(self, rolls, face_counts, face_totals, jackpots, jackpot_rolls, jackpot_faces, combinations,
+                 permutations):
+        """
+        PURPOSE:
+        Initializes the statistics of a game result
+
+        INPUTS:
+        Takes the number of rolls (int), the per roll face counts (DataFrame | None), the face totals (Series), the
+        jackpot count (int), the jackpot roll numbers (Index | None), the jackpots per face (Series) and the
+        combination and sequence counts (DataFrame, DataFrame)
+
+        OUTPUTS:
+        Assigns the statistics
+        """
+        self.rolls = rolls
+        self.face_counts = face_counts
+        self.face_totals = face_totals
+        self.jackpots = jackpots
+        self.jackpot_rolls = jackpot_rolls
+        self.jackpot_faces = jackpot_faces
+        self.combinations = combinations
+        self.permutations = permutations
+
+
+class WordIndex:
+    """
+    PURPOSE:
+    A word list encoded once with the face codes of a Game, to match rolls of letter dice against it
+
+    ATTRIBUTES:
+    faces:: The Game faces the words are encoded with ([str])
+    case_sensitive:: Whether the case of the words and faces matters (bool)
+    keys:: Sorted integer key of every word by word length (dict(int, np.ndarray(int)))
+    words:: The words in key order by word length (dict(int, np.ndarray(str)))
+
+    METHODS:
+    __init__:: Encode the words
+    find:: Look keys of a given length up
+    -------------------------------------------------------------------------
+    """
+
+    def __init__(self, words, faces, case_sensitive=False):
+        """
+        PURPOSE:
+        Encode every word spelled with the faces as the mixed-radix key of its face codes
+
+        INPUTS:
+        Takes the words ([str]) or the path of a file of one word per line (str), the Game faces each character of a
+        word is matched against the string form of ([int | str | float]) and whether the case matters (bool)
+
+        OUTPUTS:
+        Assigns the sorted keys and words by word length, words with a character that is not a face are left out
+        """
+        if isinstance(words, str):
+            with open(words) as word_file:
+                words = word_file.read().split()
+        normalize = (lambda text: text) if case_sensitive else str.lower
+        self.faces = list(faces)
+        self.case_sensitive = case_sensitive
+        face_index = {normalize(str(face)): code for code, face in enumerate(faces)}
+        face_count = max(len(faces), 1)
+
+        encoded = {}
+        for word in words:
+            codes = [face_index.get(character) for character in normalize(word)]
+            if codes and None not in codes:
+                encoded.setdefault(len(codes), {})[normalize(word)] = codes
+        self.keys, self.words = {}, {}
+        for length, length_words in encoded.items():
+            if face_count ** length > np.iinfo(np.int64).max:
+                continue
+            radix = face_count ** np.arange(length - 1, -1, -1, dtype=np.int64)
+            keys = np.array(list(length_words.values()), dtype=np.int64) @ radix
+            order = np.argsort(keys, kind='stable')
+            self.keys[length] = keys[order]
+            self.words[length] = np.array(list(length_words), dtype=object)[order]
+
+    def find(self, keys, length):
+        """
+        PURPOSE:
+        Look keys of words of one length up in the index
+
+        INPUTS:
+        Takes the keys to look up (np.ndarray(int)) and their word length (int)
+
+        OUTPUTS:
+        Returns the position of every key among the words of that length, -1 when it is not a word
+        (np.ndarray(int))
+        """
+        word_keys = self.keys.get(length, np.empty(0, dtype=np.int64))
+        positions = np.minimum(np.searchsorted(word_keys, keys), max(len(word_keys) - 1, 0))
+        is_word = (word_keys[positions] == keys) if len(word_keys) else np.zeros(len(keys), dtype=bool)
+        return np.where(is_word, positions, -1)
+
+
+class Analyzer:
+    """
+    PURPOSE:
+    A class to take the results of a single game and compute statistical properties about it.
+
+    ATTRIBUTES:
+
+    METHODS: __init__:: Instantiate a Game Objects from the Game Class and infers the data type of the die faces.
+    face counts per roll, i.e. the number of times a given face appeared in each roll. For example, if a roll of five
+    dice has all sixes, then the counts for this roll would be 6 for the face value '6' and 0 for the other faces.
+    jackpot count, i.e. how many times a roll resulted in all faces being the same, e.g. six ones for a six-sided
+    die. combo count, i.e. how many combination types of faces were rolled and their counts. permutation count,
+    i.e. how may sequence types were rolled and their counts.
+    -------------------------------------------------------------------------
+    """
+
+    # Largest total size in bytes of the results kept in the cache, the least recently used are evicted first
+    max_cache_bytes = 2 ** 28
+
+    def __init__(self, game, backend=None):
+        """
+        PURPOSE:
+        Initializes the game object which is inherited from the Game Class
+
+        INPUTS:
+        Takes one argument which is a Game Object and an optional backend name (str) running the analysis kernels,
+        by default the backend of the Game
+
+        OUTPUTS:
+        Assigns Game Object for internal use , Game dataframe type (int | str | float),
+        Result of the Game played([int | str | float])
+        """
+        self.game = game
+        # Infers the data type of the die faces
+        self.game_df_data_type = type(game.dice[0].faces[1])
+        # Results of the statistics already computed on the current game result
+        self.cache = OrderedDict()
+        self.cache_bytes = 0
+        # Memory-mapped face codes of a play opened with Analyzer.from_file
+        self.store = None
+        # Phase timings shared with an instrumented Game
+        self.stats = game.stats
+        self.backend = backend
+        self._snapshot()
+
+    @classmethod
+    def from_file(cls, path, chunk_size=100000):
+        """
+        PURPOSE:
+        Open a play written by Game.play_to_file and fold it chunk by chunk into the running totals, reading the
+        memory-mapped file so that it is never loaded all at once and can be shared by several processes
+
+        INPUTS:
+        Takes the path of the .npy file (str) and the number of rolls per chunk (int)
+
+        OUTPUTS:
+        Returns an Analyzer of a Game with the stored dice holding the statistics of every stored roll, the
+        memory-mapped matrix of face codes is kept as Analyzer.store (Analyzer). The statistics saved by
+        Game.play_to_file are loaded as they are, the rolls are only read when there are none
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be a positive number of rolls.")
+        with open(path + '.json') as sidecar:
+            metadata = json.load(sidecar)
+        dice = []
+        for stored_die in metadata['dice']:
+            die = Die(stored_die['faces'])
+            for face, weight in zip(stored_die['faces'], stored_die['weights']):
+                die.change_weight(face, weight)
+            dice.append(die)
+        game = Game(dice)
+        game.number_of_rolls = metadata['rolls']
+        game.columns = metadata['columns']
+        game.faces = game._game_faces()
+        game.cols = [str(face) for face in game.faces]
+
+        analyzer = cls(game)
+        analyzer.store = np.load(path, mmap_mode='r')
+        # The faces of the rebuilt dice may come out in another order than the stored face table
+        lookup = np.array([game.faces.index(face) for face in metadata['faces']], dtype=analyzer.store.dtype)
+        is_same_order = np.array_equal(lookup, np.arange(len(lookup)))
+        # The saved statistics hold codes into the stored face table, so they are only taken in the same order
+        summary_path = os.path.join(os.path.dirname(path), metadata['summary']) if 'summary' in metadata else None
+        if is_same_order and summary_path is not None and os.path.exists(summary_path):
+            summary = _load_checkpoint(summary_path)
+            if summary['rolls'] == metadata['rolls']:
+                analyzer._restore_stream_state(summary['analyzer'])
+                return analyzer
+        for first_roll in range(0, len(analyzer.store), chunk_size):
+            chunk = np.asarray(analyzer.store[first_roll:first_roll + chunk_size])
+            analyzer.update(chunk if is_same_order else lookup[chunk])
+        return analyzer
+
+    def _snapshot(self):
+        """
+        PURPOSE:
+        Take the current result of the Game and forget everything computed from an earlier one
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Assigns the Game result, its generation and dice versions, and resets the statistics and the cache
+        """
+        game = self.game
+        self.game_result = game.play_result_df_list
+        # None while the Game has not built its play dataframe, the result is then Game.codes
+        self.game_result_df = game._play_df
+        self.game_codes = game.codes
+        # Codes of an assigned play dataframe, looked up from its faces when Game.codes are stale
+        self.game_codes_stale = game.codes_stale
+        self.frame_codes = None
+        self.game_generation = game.generation
+        self.game_play_df_version = game.play_df_version
+        self.game_dice_versions = [die.version for die in game.dice]
+        self.game_sampling = game.sampling
+        self.game_roll_weights = game.roll_weights
+        self.game_stratum_probabilities = game.stratum_probabilities
+        # Face count
+        self.face_count_df = pd.DataFrame()
+        self.face_list = []
+        # Jackpot
+        self.jackpot_list = []
+        self.jackpot_results_df = pd.DataFrame()
+        self.jackpot_results_df.index.name = ''
+        self.jack_pot_indices = []
+        # Combination
+        self.combination_list = []
+        self.combination_df = pd.DataFrame()
+        # Permutation
+        self.permutation_list = []
+        self.permutation_df = pd.DataFrame()
+        # Word matches
+        self.word_match_df = pd.DataFrame()
+        self.word_match_rolls = []
+        # Roll keys shared by the statistics, built on first use and extended with the rolls appended since
+        self.permutation_keys = None
+        self.combination_keys = None
+        self.processed_rolls = 0
+        # Per roll results worked out in one pass by _fold_rolls, only the rolls appended since are folded in next
+        self.face_counts = None
+        self.jackpot_rows = np.zeros(0, dtype=bool)
+        # Buffers the per roll results of appended rolls are written to, by per roll result name
+        self.row_buffers = {}
+        self.result_permutation_counter = None
+        self.result_combination_counter = None
+        # Face and jackpot totals of the rolls folded in, by _fold_rolls or chunk by chunk by update
+        self.streamed_rolls = 0
+        self.face_totals = np.zeros(len(game.faces), dtype=np.int64)
+        self.jackpot_totals = np.zeros(len(game.faces), dtype=np.int64)
+        self.permutation_counter = None
+        self.combination_counter = None
+        # Generation of the Game play the last chunk was streamed from
+        self.stream_generation = game.generation
+        self.cache.clear()
+        self.cache_bytes = 0
+
+    def _sync(self):
+        """
+        PURPOSE:
+        Follow the Game result: rolls appended to the play are adopted, while a replay, a replaced play dataframe
+        or a weight change starts over from the new result. Streamed totals are kept until the Game plays again
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Updates the Game result and clears the cache when the result changed
+        """
+        game = self.game
+        if self.permutation_counter is not None:
+            if game.generation > self.stream_generation:
+                self._snapshot()
+            return
+        is_same_play = game.generation == self.game_generation and game.play_df_version == self.game_play_df_version \
+            and [die.version for die in game.dice] == self.game_dice_versions
+        if is_same_play and len(game.codes) == len(self.game_codes):
+            return
+        if is_same_play and len(game.codes) > len(self.game_codes):
+            # Rolls were appended to the play analyzed so far, only these are processed on the next call
+            self.game_result_df = game._play_df
+            self.game_codes = game.codes
+            self.cache.clear()
+            self.cache_bytes = 0
+        else:
+            self._snapshot()
+
+    def _memoized(self, name, compute, attributes, *args):
+        """
+        PURPOSE:
+        Return a statistic from the cache, or compute and cache it along with the result attributes it assigns
+
+        INPUTS:
+        Takes the statistic name (str), the method computing it, the names of the Analyzer attributes it assigns
+        ([str]) and its arguments
+
+        OUTPUTS:
+        Returns the statistic and restores its result attributes
+        """
+        self._sync()
+        key = (name,) + args
+        if key in self.cache:
+            if self.stats is not None:
+                self.stats.cache_hits += 1
+            self.cache.move_to_end(key)
+            value, saved = self.cache[key]
+            for attribute, saved_value in saved.items():
+                setattr(self, attribute, saved_value)
+            return value
+
+        started = time.perf_counter() if self.stats is not None else None
+        value = compute(*args)
+        saved = {attribute: getattr(self, attribute) for attribute in attributes}
+        size = sum(_nbytes(result) for result in [value] + list(saved.values()))
+        if self.stats is not None:
+            self.stats.cache_misses += 1
+            self.stats.record(name, started, self.processed_rolls + self.streamed_rolls, size)
+        if size <= self.max_cache_bytes:
+            self.cache[key] = (value, saved)
+            self.cache_bytes += size
+            while self.cache_bytes > self.max_cache_bytes:
+                _, (old_value, old_saved) = self.cache.popitem(last=False)
+                self.cache_bytes -= sum(_nbytes(result) for result in [old_value] + list(old_saved.values()))
+        return value
+
+    # Fold a chunk of streamed rolls into the running totals
+    def update(self, chunk):
+        """
+        PURPOSE:
+        Fold one chunk of rolls from Game.play_stream into the running face totals, jackpot totals and
+        combination/permutation counters, so the chunk can be dropped afterwards
+
+        INPUTS:
+        Takes one argument which is an outcome matrix of shape chunk rolls by M dice of face codes (np.ndarray(uint))
+
+        OUTPUTS:
+        Updates the running totals; face_count, jackpot, combo and permutation then report on every roll folded in
+        """
+        started = time.perf_counter() if self.stats is not None else None
+        face_count = len(self.game.faces)
+        if self.permutation_counter is None:
+            self.face_totals = np.zeros(face_count, dtype=np.int64)
+            self.jackpot_totals = np.zeros(face_count, dtype=np.int64)
+            self.permutation_counter = _KeyCounter(chunk.shape[1], chunk.dtype)
+            self.combination_counter = _KeyCounter(chunk.shape[1], chunk.dtype)
+        sorted_chunk = np.sort(chunk, axis=1)
+        permutation_keys = self._row_keys(chunk)
+        combination_keys = self._row_keys(sorted_chunk)
+
+        self.streamed_rolls += len(chunk)
+        self.stream_generation = self.game.generation
+        self.cache.clear()
+        self.cache_bytes = 0
+        self.face_totals += np.bincount(chunk.ravel(), minlength=face_count)
+        is_jackpot = self._jackpot_mask(chunk, permutation_keys)
+        self.jackpot_totals += np.bincount(chunk[is_jackpot, 0], minlength=face_count)
+        for counter, keys, rows in [(self.permutation_counter, permutation_keys, chunk),
+                                    (self.combination_counter, combination_keys, sorted_chunk)]:
+            counter.add(*self._distinct_keys(keys, rows))
+        if self.stats is not None:
+            self.stats.record('update', started, len(chunk))
+
+    def _stream_state(self):
+        """
+        PURPOSE:
+        Collect the running totals folded in by update, to be saved in a checkpoint
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the totals and the keys, rows and counts of both counters by name (dict(np.ndarray))
+        """
+        state = {'streamed_rolls': self.streamed_rolls, 'face_totals': self.face_totals,
+                 'jackpot_totals': self.jackpot_totals}
+        if self.permutation_counter is not None:
+            for name, counter in [('permutation', self.permutation_counter), ('combination', self.combination_counter)]:
+                state.update({name + '_keys': counter.keys, name + '_rows': counter.rows,
+                              name + '_counts': counter.counts})
+        return state
+
+    def _restore_stream_state(self, state):
+        """
+        PURPOSE:
+        Put back the running totals saved in a checkpoint
+
+        INPUTS:
+        Takes the totals and counters by name as returned by _stream_state (dict(np.ndarray))
+
+        OUTPUTS:
+        Assigns the running totals so that update carries on from them
+        """
+        self.streamed_rolls = int(state['streamed_rolls'])
+        self.face_totals = np.array(state['face_totals'], dtype=np.int64)
+        self.jackpot_totals = np.array(state['jackpot_totals'], dtype=np.int64)
+        if 'permutation_keys' in state:
+            self.permutation_counter = _KeyCounter(0)
+            self.combination_counter = _KeyCounter(0)
+            for name, counter in [('permutation', self.permutation_counter), ('combination', self.combination_counter)]:
+                counter.keys, counter.rows = state[name + '_keys'], state[name + '_rows']
+                counter.counts = state[name + '_counts']
+                counter.rolls = int(counter.counts.sum())
+        self.cache.clear()
+        self.cache_bytes = 0
+
+    def _distinct_keys(self, keys, rows):
+        """
+        PURPOSE:
+        Reduce a chunk of roll keys to its distinct keys in sorted order
+
+        INPUTS:
+        Takes the key of every roll (np.ndarray(int)) and the matching rows of face codes (np.ndarray(uint))
+
+        OUTPUTS:
+        Returns the distinct keys, one row of face codes per key and the counts (np.ndarray(int), np.ndarray(uint),
+        np.ndarray(int))
+        """
+        face_count = max(len(self.game.faces), 1)
+        key_space = face_count ** rows.shape[1]
+        if key_space <= 2 ** 20:
+            # Small games count every possible key directly and decode the mixed-radix digits back to faces
+            all_counts = np.bincount(keys, minlength=key_space)
+            distinct_keys = np.flatnonzero(all_counts)
+            radix = face_count ** np.arange(rows.shape[1] - 1, -1, -1, dtype=np.int64)
+            distinct_rows = (distinct_keys[:, None] // radix) % face_count
+            return distinct_keys, distinct_rows.astype(rows.dtype), all_counts[distinct_keys]
+        distinct_keys, first_rows, counts = np.unique(keys, return_index=True, return_counts=True)
+        return distinct_keys, rows[first_rows], counts
+
+    # Compute every statistic in one pass over the result
+    def summary(self):
+        """
+        PURPOSE:
+        Method to compute the face counts, jackpots, combinations and sequences of the game together, in a single
+        pass over the rolls not analyzed yet. face_count, jackpot, combo and permutation are built from it
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the statistics of the game result (Summary)
+        """
+        return self._memoized('summary', self._summary, [])
+
+    def _summary(self):
+        """
+        PURPOSE:
+        Compute every statistic of the game result without looking at the cache
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the result of Analyzer.summary
+        """
+        if self.permutation_counter is not None:
+            rolls, face_counts, jackpot_rolls = self.streamed_rolls, None, None
+        else:
+            self._fold_rolls()
+            rolls = self.processed_rolls
+            index = self._result_index()
+            face_counts = pd.DataFrame(self.face_counts, index=index, columns=self.game.cols)
+            face_counts.index.name = 'roll number'
+            jackpot_rolls = index[self.jackpot_rows]
+        combinations, combination_counts = self._combination_counts()
+        permutations, permutation_counts = self._permutation_counts()
+        return Summary(rolls, face_counts, pd.Series(self.face_totals, index=self.game.cols, name='count'),
+                       int(self.jackpot_totals.sum()), jackpot_rolls,
+                       pd.Series(self.jackpot_totals, index=self.game.cols, name='jackpots'),
+                       self._counts_df(combinations, combination_counts),
+                       self._counts_df(permutations, permutation_counts))
+
+    # Method to compute how many times a given face is rolled in each event
+
+    def face_count(self):
+        """
+        PURPOSE:
+        Method to compute how many times a given face is rolled in each event
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the Face Count dataframe according to the initial dice face type (DataFrame(int | str | float))
+        For streamed rolls the per roll counts are not kept and the single row 'total' holds the face totals
+        """
+        return self._memoized('face_count', self._face_count, ['face_count_df', 'face_list'])
+
+    def _face_count(self):
+        """
+        PURPOSE:
+        Compute how many times a given face is rolled in each event without looking at the cache
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the result of Analyzer.face_count
+        """
+        summary = self.summary()
+        if summary.face_counts is None:
+            self.face_count_df = pd.DataFrame([summary.face_totals], index=['total'], columns=self.game.cols)
+        else:
+            self.face_count_df = summary.face_counts.astype(int)
+        self.face_count_df.index.name = 'roll number'
+        self.face_list = np.zeros(len(self.game.cols), dtype=int)
+
+        return self.face_count_df
+
+    def _result_codes(self):
+        """
+        PURPOSE:
+        Get the game result as integer codes into the Game cols/faces lookup table
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the outcome matrix of shape N rolls by M dice (np.ndarray(uint))
+        """
+        if not self.game_codes_stale or self.game_result_df is None:
+            return self.game_codes
+        if self.frame_codes is None:
+            # The result dataframe was not produced by Game.play so look the faces up by their string form
+            face_lookup = pd.Index(self.game.cols)
+            self.frame_codes = np.column_stack([face_lookup.get_indexer(self.game_result_df[col].astype(str))
+                                                for col in self.game.columns])
+        return self.frame_codes
+
+    def _result_index(self):
+        """
+        PURPOSE:
+        Get the roll numbers of the game result
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the index of the result dataframe, or the roll numbers of Game.codes when the Game has not built it
+        (pd.Index)
+        """
+        if self.game_result_df is None:
+            return pd.RangeIndex(1, len(self.game_codes) + 1, name='roll number')
+        return self.game_result_df.index
+
+    # Method to compute how many times the game resulted in all faces being identical
+    def jackpot(self):
+        """
+        PURPOSE:
+        Method to compute how many times the game resulted in all faces being identical
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the count of how many times the game resulted in all faces being identical
+        You can also access the Jackpot Dataframe using Class Analyzer.jackpot_results_df
+        For streamed rolls the Jackpot Dataframe holds the single row 'total' of the jackpot face counts
+        """
+        return self._memoized('jackpot', self._jackpot, ['jackpot_list', 'jackpot_results_df', 'jack_pot_indices'])
+
+    def _jackpot(self):
+        """
+        PURPOSE:
+        Compute how many times the game resulted in all faces being identical without looking at the cache
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the result of Analyzer.jackpot
+        """
+        self.jackpot_list = np.zeros(len(self.game.cols), dtype=int)
+        summary = self.summary()
+        if summary.jackpot_rolls is None:
+            self.jackpot_results_df = pd.DataFrame([summary.jackpot_faces * len(self.game.dice)], index=['total'],
+                                                   columns=self.game.cols)
+            self.jackpot_results_df.index.name = 'roll number'
+            self.jack_pot_indices = []
+            return summary.jackpots
+
+        jackpot_counts = np.zeros((summary.jackpots, len(self.game.cols)), dtype=int)
+        if len(self.game.dice):
+            jackpot_counts[np.arange(summary.jackpots), self._result_codes()[self.jackpot_rows, 0]] = \
+                len(self.game.dice)
+        self.jackpot_results_df = pd.DataFrame(jackpot_counts, index=summary.jackpot_rolls, columns=self.game.cols)
+        self.jackpot_results_df.index.name = 'roll number'
+        self.jack_pot_indices = (summary.jackpot_rolls + 1).tolist()
+
+        return summary.jackpots
+
+    def jackpot_estimate(self):
+        """
+        PURPOSE:
+        Method to estimate the probability of a roll resulting in all faces being identical, weighting every roll
+        by its likelihood ratio so that variance reduced plays stay unbiased
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the estimate and its standard error (Series(float))
+        """
+        return self._memoized('jackpot_estimate', self._jackpot_estimate, [])
+
+    def _jackpot_estimate(self):
+        """
+        PURPOSE:
+        Compute the weighted estimate of the jackpot probability without looking at the cache
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the result of Analyzer.jackpot_estimate
+        """
+        if self.permutation_counter is not None:
+            groups = np.zeros(0, dtype=np.int64)
+            estimate, standard_error = self._weighted_estimates(groups, 1, int(self.jackpot_totals.sum()))
+        else:
+            self._fold_rolls()
+            estimate, standard_error = self._weighted_estimates(np.where(self.jackpot_rows, 0, -1), 1)
+        return pd.Series({'estimate': estimate[0], 'standard error': standard_error[0]})
+
+    def combo_estimate(self):
+        """
+        PURPOSE:
+        Method to estimate the probability of every combination rolled, order not mattering, weighting every roll
+        by its likelihood ratio so that variance reduced plays stay unbiased
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the estimate and standard error of each combination, indexed like the sparse Analyzer.combination_df
+        (DataFrame(float))
+        """
+        return self._memoized('combo_estimate', self._combo_estimate, [])
+
+    def _combo_estimate(self):
+        """
+        PURPOSE:
+        Compute the weighted estimate of every combination probability without looking at the cache
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the result of Analyzer.combo_estimate
+        """
+        combinations, counts = self._combination_counts()
+        if self.permutation_counter is not None:
+            estimate, standard_error = self._weighted_estimates(np.zeros(0, dtype=np.int64), len(counts), counts)
+        else:
+            _, combination_keys = self._outcome_keys()
+            _, groups = np.unique(combination_keys, return_inverse=True)
+            estimate, standard_error = self._weighted_estimates(groups.ravel(), len(counts))
+        estimates_df = self._counts_df(combinations, counts).drop(columns='count')
+        estimates_df['estimate'] = estimate
+        estimates_df['standard error'] = standard_error
+        return estimates_df
+
+    def _weighted_estimates(self, groups, number_of_groups, streamed_counts=None):
+        """
+        PURPOSE:
+        Estimate the probability of groups of rolls with the estimator matching the sampling of the play
+
+        INPUTS:
+        Takes the group of every roll, -1 for none (np.ndarray(int)), the number of groups (int) and for streamed
+        rolls the count of every group instead (np.ndarray(int) | None)
+
+        OUTPUTS:
+        Returns the estimate and standard error of every group (np.ndarray(float), np.ndarray(float))
+        """
+        if streamed_counts is not None:
+            # Streamed plays are plain so the estimate is the relative frequency
+            number_of_rolls = max(self.streamed_rolls, 1)
+            estimate = np.asarray(streamed_counts, dtype=float) / number_of_rolls
+            return estimate, np.sqrt(estimate * (1 - estimate) / max(number_of_rolls - 1, 1))
+
+        number_of_rolls = len(groups)
+        if number_of_rolls < 2:
+            return np.zeros(number_of_groups), np.full(number_of_groups, np.nan)
+        weights = np.ones(number_of_rolls) if self.game_roll_weights is None else self.game_roll_weights
+        counted = groups >= 0
+        weighted_sum = np.bincount(groups[counted], weights=weights[counted], minlength=number_of_groups)
+        squared_sum = np.bincount(groups[counted], weights=weights[counted] ** 2, minlength=number_of_groups)
+        estimate = weighted_sum / number_of_rolls
+
+        if self.game_sampling == 'stratified':
+            # Within a face of the first die every roll has the same weight: add up the binomial stratum variances
+            strata = self._result_codes()[:, 0].astype(np.int64)
+            stratum_rolls = np.bincount(strata, minlength=len(self.game_stratum_probabilities))
+            stratum_hits = np.bincount(strata[counted] * number_of_groups + groups[counted],
+                                       minlength=len(stratum_rolls) * number_of_groups).reshape(-1, number_of_groups)
+            sampled = stratum_rolls > 1
+            hit_rate = stratum_hits[sampled] / stratum_rolls[sampled, None]
+            stratum_share = self.game_stratum_probabilities[sampled, None] / self.game_stratum_probabilities.sum()
+            variance = (stratum_share ** 2 * hit_rate * (1 - hit_rate) / (stratum_rolls[sampled, None] - 1)).sum(axis=0)
+            return estimate, np.sqrt(variance)
+
+        if self.game_sampling == 'antithetic' and number_of_rolls >= 4:
+            # The two rolls of a pair are dependent, so the variance comes from the pair averages
+            pairs = number_of_rolls // 2
+            first, second = groups[0:2 * pairs:2], groups[1:2 * pairs:2]
+            paired = counted[:2 * pairs]
+            pair_squares = np.bincount(groups[:2 * pairs][paired], minlength=number_of_groups).astype(float)
+            same_group = (first == second) & (first >= 0)
+            pair_squares += 2 * np.bincount(first[same_group], minlength=number_of_groups)
+            pair_mean = np.bincount(groups[:2 * pairs][paired], minlength=number_of_groups) / (2 * pairs)
+            pair_variance = (pair_squares / 4 / pairs - pair_mean ** 2) * pairs / (pairs - 1)
+            return estimate, np.sqrt(np.maximum(pair_variance, 0) / pairs)
+
+        # Plain and importance sampling: the sample variance of the weighted indicators
+        variance = (squared_sum / number_of_rolls - estimate ** 2) * number_of_rolls / (number_of_rolls - 1)
+        return estimate, np.sqrt(np.maximum(variance, 0) / number_of_rolls)
+
+    def _jackpot_mask(self, codes, permutation_keys):
+        """
+        PURPOSE:
+        Find the rolls that resulted in all faces being identical
+
+        INPUTS:
+        Takes the outcome matrix of face codes (np.ndarray(uint)) and the matching permutation keys (np.ndarray(int))
+
+        OUTPUTS:
+        Returns True for every jackpot roll (np.ndarray(bool))
+        """
+        # A jackpot is a roll whose ordered key is the key of one face repeated on every die
+        jackpot_faces = np.arange(len(self.game.faces))
+        jackpot_keys = self._row_keys(np.repeat(jackpot_faces[:, None], codes.shape[1], axis=1))
+        return np.isin(permutation_keys, jackpot_keys)
+
+    def _fold_rolls(self):
+        """
+        PURPOSE:
+        Work out in a single pass over the rolls not processed yet everything the statistics are built from: the
+        face counts, the ordered and sorted keys, the jackpot flags and the counts of every sequence and combination
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Updates the per roll results, totals and counters so they cover every roll of the game result
+        """
+        codes = self._result_codes()
+        if self.face_counts is not None and self.processed_rolls == len(codes):
+            return
+        face_count = len(self.game.cols)
+        if self.face_counts is None:
+            # A roll shows a face at most once per die, so the counts fit the smallest type holding M
+            self.face_counts = np.zeros((0, face_count), dtype=np.min_scalar_type(codes.shape[1]))
+            self.face_totals = np.zeros(face_count, dtype=np.int64)
+            self.jackpot_totals = np.zeros(face_count, dtype=np.int64)
+            self.permutation_keys = np.zeros(0, dtype=np.int64)
+            self.combination_keys = np.zeros(0, dtype=np.int64)
+            self.result_permutation_counter = _KeyCounter(codes.shape[1], codes.dtype)
+            self.result_combination_counter = _KeyCounter(codes.shape[1], codes.dtype)
+        started = time.perf_counter() if self.stats is not None else None
+        new_codes = codes[self.processed_rolls:]
+        sorted_codes = np.sort(new_codes, axis=1)
+
+        face_counts = self._backend(new_codes.size).face_counts(new_codes, face_count, self.face_counts.dtype)
+        # A jackpot roll shows a single face on every die
+        is_jackpot = face_counts.max(axis=1, initial=0) == codes.shape[1] if codes.shape[1] else \
+            np.zeros(len(new_codes), dtype=bool)
+        permutation_keys = self._row_keys(new_codes)
+        combination_keys = self._row_keys(sorted_codes)
+        self.result_permutation_counter.add(*self._distinct_keys(permutation_keys, new_codes))
+        self.result_combination_counter.add(*self._distinct_keys(combination_keys, sorted_codes))
+
+        self.face_totals += face_counts.sum(axis=0, dtype=np.int64)
+        if codes.shape[1]:
+            self.jackpot_totals += np.bincount(new_codes[is_jackpot, 0], minlength=face_count)
+        if self.processed_rolls:
+            buffers = self.row_buffers
+            face_counts, buffers['face_counts'] = _extend(self.face_counts, face_counts, buffers.get('face_counts'))
+            is_jackpot, buffers['jackpot_rows'] = _extend(self.jackpot_rows, is_jackpot, buffers.get('jackpot_rows'))
+            permutation_keys, buffers['permutation_keys'] = _extend(self.permutation_keys, permutation_keys,
+                                                                    buffers.get('permutation_keys'))
+            combination_keys, buffers['combination_keys'] = _extend(self.combination_keys, combination_keys,
+                                                                    buffers.get('combination_keys'))
+        self.face_counts, self.jackpot_rows = face_counts, is_jackpot
+        self.permutation_keys, self.combination_keys = permutation_keys, combination_keys
+        if self.stats is not None:
+            self.stats.record('fold', started, len(new_codes), _nbytes(self.face_counts))
+        self.processed_rolls = len(codes)
+
+    def _outcome_keys(self):
+        """
+        PURPOSE:
+        Get the ordered (permutation) and sorted multiset (combination) key of every roll
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the permutation and the combination keys of shape N rolls (np.ndarray(int), np.ndarray(int))
+        You can also access them using Class Analyzer.permutation_keys and Analyzer.combination_keys
+        """
+        self._fold_rolls()
+        return self.permutation_keys, self.combination_keys
+
+    def _row_keys(self, codes):
+        """
+        PURPOSE:
+        Encode every row of face codes as one integer key
+
+        INPUTS:
+        Takes the outcome matrix of shape N rolls by M dice (np.ndarray(uint))
+
+        OUTPUTS:
+        Returns the mixed-radix key of every row, or a 64 bit hash of the row when F^M overflows int64
+        (np.ndarray(int))
+        """
+        face_count = max(len(self.game.faces), 1)
+        if face_count ** codes.shape[1] <= np.iinfo(np.int64).max:
+            return self._backend(codes.size).row_keys(codes, face_count)
+        return pd.util.hash_pandas_object(pd.DataFrame(codes), index=False).to_numpy().view(np.int64)
+
+    def _backend(self, cells):
+        """
+        PURPOSE:
+        Pick the backend running the analysis kernels over some rolls
+
+        INPUTS:
+        Takes the size of the rolls in rolls x dice (int)
+
+        OUTPUTS:
+        Returns the backend of the Analyzer, or else of the Game, sized to the rolls (PythonBackend)
+        """
+        return _select_backend(self.game.backend if self.backend is None else self.backend, cells)
+
+    def _permutation_counts(self):
+        """
+        PURPOSE:
+        Get the distinct ordered sequences rolled and their counts, from the game result or the streamed totals
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns one row of face codes per sequence and its count (np.ndarray(uint), np.ndarray(int))
+        """
+        if self.permutation_counter is not None:
+            return self.permutation_counter.rows, self.permutation_counter.counts
+        self._fold_rolls()
+        return self.result_permutation_counter.rows, self.result_permutation_counter.counts
+
+    def _combination_counts(self):
+        """
+        PURPOSE:
+        Get the distinct combinations rolled and their counts, from the game result or the streamed totals
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns one sorted row of face codes per combination and its count (np.ndarray(uint), np.ndarray(int))
+        """
+        if self.combination_counter is not None:
+            return self.combination_counter.rows, self.combination_counter.counts
+        self._fold_rolls()
+        return self.result_combination_counter.rows, self.result_combination_counter.counts
+
+    def _counts_df(self, rows, counts):
+        """
+        PURPOSE:
+        Build a count dataframe indexed by the faces of each distinct row of face codes
+
+        INPUTS:
+        Takes the distinct rows of face codes (np.ndarray(uint)) and their counts (np.ndarray(int))
+
+        OUTPUTS:
+        Returns the dataframe with one count column and a die by die MultiIndex (DataFrame(int))
+        """
+        if not self.game.columns:
+            return pd.DataFrame({'count': counts})
+        # The Game faces are the levels so no face value has to be looked up again
+        index = pd.MultiIndex(levels=[pd.Index(self.game.faces)] * len(self.game.columns),
+                              codes=rows.T, names=self.game.columns)
+        return pd.DataFrame({'count': counts}, index=index)
+
+    def _observed_faces(self):
+        """
+        PURPOSE:
+        Collect the faces that have been rolled during the Game
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the distinct faces rolled sorted according to the dice face type ([int | str | float])
+        """
+        face_values = np.array(self.game.faces, dtype=object)
+        if self.permutation_counter is None:
+            self._fold_rolls()
+        observed_faces = face_values[self.face_totals > 0].tolist()
+        observed_faces.sort(key=self.game_df_data_type)
+        return observed_faces
+
+        # Combo method to compute the distinct/unique combinations of faces rolled, along with their counts
+
+    # Count is always 1 because the specific combination only occurs Once
+    def combo(self, sparse=False):
+        """
+        PURPOSE:
+        Method to compute the distinct/unique combinations of faces rolled, along with their counts
+
+        INPUTS:
+        Takes an optional sparse flag (bool) to count only the combinations actually rolled, order not mattering
+
+        OUTPUTS: Returns the count of how many times the Game could result in distinct/unique combinations of faces
+        when dice is played/rolled You can also access the full combination multi-columned Dataframe using Class
+        Analyzer.combination_df or access the corresponding Class Analyzer.combination_list
+        When sparse the Analyzer.combination_df holds one row per observed combination with its count
+
+        """
+        return self._memoized('combo', self._combo, ['combination_list', 'combination_df'], sparse)
+
+    def _combo(self, sparse=False):
+        """
+        PURPOSE:
+        Compute the combinations of faces rolled without looking at the cache
+
+        INPUTS:
+        Takes the sparse flag (bool)
+
+        OUTPUTS:
+        Returns the result of Analyzer.combo
+        """
+        if sparse:
+            return self._sparse_combo()
+
+        # The rolled sequences with their respective count, grouped by the roll keys
+        rolled_rows, rolled_counts = self._permutation_counts()
+        face_values = np.array(self.game.faces, dtype=object)
+        face_combination_rolled = dict(zip(map(tuple, face_values[rolled_rows].tolist()), rolled_counts.tolist()))
+
+        # Perform the combination  of the unique faces rolled
+        face_combo_list = self._observed_faces()
+        combo_list = [list(face_combo_list) for _ in range(len(self.game.dice))]
+
+        # using product() to get permutations, each one followed by how many times it was rolled
+        self.combination_list = [tup + (face_combination_rolled.get(tup, 0),) for tup in product(*combo_list)]
+
+        # Construct the combination  tuples indices
+        combination_indices_list = [tuple([i] * len(self.combination_list)) for i in range(len(self.combination_list))]
+
+        # Construct the Index name
+        combination_indices_name_list = ["roll_number " + str(index + 1) for index in range(len(self.combination_list))]
+
+        # Create Row Level MultiIndex
+        combination_index = pd.MultiIndex.from_tuples(combination_indices_list, names=combination_indices_name_list)
+
+        # Create Column Level MultiIndex
+        cols = pd.MultiIndex.from_tuples(self.combination_list)
+        # Create Data for the MultiIndex table
+        data = [[1 for _ in range(len(self.combination_list))] for _ in range(len(self.combination_list))]
+        # Construct the permutation  Dataframe
+        self.combination_df = pd.DataFrame(data, columns=cols, index=combination_index)
+
+        # Return the count of all the unique combinations from the game
+        return len(face_combination_rolled)
+
+    def _sparse_combo(self):
+        """
+        PURPOSE:
+        Count the observed combinations only, grouping the rolls by their sorted multiset key
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the count of distinct combinations rolled and assigns the compact Analyzer.combination_df and
+        Analyzer.combination_list
+        """
+        self.combination_df = self.summary().combinations
+        counts = self.combination_df['count'].to_numpy()
+        self.combination_list = [index + (count,) for index, count in
+                                 zip(self.combination_df.index.tolist(), counts.tolist())]
+        return len(self.combination_list)
+
+    # Permutation order matters , so we will have to look through all the possible values
+    def permutation(self, sparse=False):
+        """
+        PURPOSE:
+        Method to compute how may sequence types were rolled and their counts
+
+        INPUTS:
+        Takes an optional sparse flag (bool) to count only the ordered sequences actually rolled
+
+        OUTPUTS:
+        Returns the count of all the possible combinations of faces present when dice is played/rolled
+        You can also access the permutation multi-columned Dataframe using Class Analyzer.permutation_df
+        When sparse returns the count of distinct sequences rolled and Analyzer.permutation_df holds one row per
+        observed sequence with its count
+        """
+        return self._memoized('permutation', self._permutation, ['permutation_list', 'permutation_df'], sparse)
+
+    def _permutation(self, sparse=False):
+        """
+        PURPOSE:
+        Compute the sequences of faces rolled without looking at the cache
+
+        INPUTS:
+        Takes the sparse flag (bool)
+
+        OUTPUTS:
+        Returns the result of Analyzer.permutation
+        """
+        if sparse:
+            return self._sparse_permutation()
+
+        # Perform the permutation  of the unique faces rolled and store it in self.permutation_df for public access
+        face_permutation_list = self._observed_faces()
+        perm_list = [list(face_permutation_list) for _ in range(len(self.game.dice))]
+
+        # using product() to get permutation s
+        self.permutation_list = list(product(*perm_list))
+
+        # Construct the permutation  tuples indices
+        permutation_indices_list = [tuple([i] * len(self.permutation_list)) for i in range(len(self.permutation_list))]
+
+        # Construct the Index name
+        permutation_indices_name_list = ["roll_number " + str(index + 1) for index in range(len(self.permutation_list))]
+
+        # Create Row Level MultiIndex
+        permutation_index = pd.MultiIndex.from_tuples(permutation_indices_list, names=permutation_indices_name_list)
+
+        # Create Column Level MultiIndex
+        cols = pd.MultiIndex.from_tuples(self.permutation_list)
+
+        # Create Data for the MultiIndex table
         data = [[1 for _ in range(len(self.permutation_list))] for _ in range(len(self.permutation_list))]
         # Construct the permutation  Dataframe
         self.permutation_df = pd.DataFrame(data, columns=cols, index=permutation_index)
         return len(self.permutation_list)
+
+    def _sparse_permutation(self):
+        """
+        PURPOSE:
+        Count the observed ordered sequences only, grouping the rolls by their ordered key
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the count of distinct sequences rolled and assigns the compact Analyzer.permutation_df and
+        Analyzer.permutation_list
+        """
+        self.permutation_df = self.summary().permutations
+        self.permutation_list = self.permutation_df.index.tolist()
+        return len(self.permutation_list)
+
+    # Match the rolls of letter dice against words
+    def match_words(self, words, mode='exact', min_length=3):
+        """
+        PURPOSE:
+        Method to count the rolls spelling words, with the word list encoded once with the face codes so that all
+        the rolls are matched in one vectorized pass instead of a scan of the word list per roll
+
+        INPUTS:
+        Takes the words as a WordIndex built with the Game faces, a list ([str]) or the path of a file of one word per
+        line (str), the mode (str): 'exact' for rolls spelling a whole word with their M dice, 'substring' for rolls
+        showing a word of min_length (int) letters or more on consecutive dice, or 'pattern' for rolls matching
+        patterns of M characters where '?' stands for any face, e.g. 'c?t??'
+
+        OUTPUTS:
+        Returns the count of rolls with at least one match (int). You can also access the number of rolls matching
+        each word or pattern using Class Analyzer.word_match_df and the roll numbers matching using
+        Analyzer.word_match_rolls (None for streamed rolls)
+        """
+        if mode not in ('exact', 'substring', 'pattern'):
+            return "Error:The mode can only be 'exact', 'substring' or 'pattern'."
+        self._sync()
+        is_streamed = self.permutation_counter is not None
+        started = time.perf_counter() if self.stats is not None else None
+        # Streamed rolls are matched through their distinct sequences weighted by their counts
+        rows = self.permutation_counter.rows if is_streamed else self._result_codes()
+        roll_counts = self.permutation_counter.counts if is_streamed else np.ones(len(rows), dtype=np.int64)
+
+        if mode == 'pattern':
+            labels, matched_rows, matched_labels = self._pattern_matches(words, rows)
+            if isinstance(labels, str):
+                return labels
+        else:
+            word_index = words if isinstance(words, WordIndex) else WordIndex(words, self.game.faces)
+            if [str(face) for face in word_index.faces] != self.game.cols:
+                return "Error:The word index was built for other faces."
+            lengths = [rows.shape[1]] if mode == 'exact' else range(max(min_length, 1), rows.shape[1] + 1)
+            labels, matched_rows, matched_labels = [], [], []
+            for length in lengths:
+                if length not in word_index.keys:
+                    continue
+                radix = len(word_index.faces) ** np.arange(length - 1, -1, -1, dtype=np.int64)
+                for start in range(rows.shape[1] - length + 1):
+                    positions = word_index.find(rows[:, start:start + length].astype(np.int64) @ radix, length)
+                    is_word = positions >= 0
+                    matched_rows.append(np.flatnonzero(is_word))
+                    matched_labels.append(len(labels) + positions[is_word])
+                labels.extend(word_index.words[length].tolist())
+            matched_rows = np.concatenate(matched_rows) if matched_rows else np.empty(0, dtype=np.int64)
+            matched_labels = np.concatenate(matched_labels) if matched_labels else np.empty(0, dtype=np.int64)
+
+        # A word showing twice in the same roll counts that roll once
+        pairs = np.unique(matched_rows.astype(np.int64) * max(len(labels), 1) + matched_labels)
+        matched_rows, matched_labels = pairs // max(len(labels), 1), pairs % max(len(labels), 1)
+        counts = np.bincount(matched_labels, weights=roll_counts[matched_rows], minlength=len(labels)).astype(np.int64)
+        self.word_match_df = pd.DataFrame({'count': counts}, index=pd.Index(labels, name='word', dtype=object))
+        self.word_match_df = self.word_match_df[self.word_match_df['count'] > 0].sort_values(
+            'count', ascending=False, kind='stable')
+        matched_rolls = np.unique(matched_rows)
+        self.word_match_rolls = None if is_streamed else self._result_index()[matched_rolls]
+        if self.stats is not None:
+            self.stats.record('match', started, int(roll_counts.sum()), _nbytes(self.word_match_df))
+        return int(roll_counts[matched_rolls].sum())
+
+    def _pattern_matches(self, patterns, rows):
+        """
+        PURPOSE:
+        Find the rolls matching positional patterns
+
+        INPUTS:
+        Takes the patterns of one character per die, '?' standing for any face ([str]) and the rows of face codes
+        (np.ndarray(uint))
+
+        OUTPUTS:
+        Returns the patterns, the row and the pattern number of every match ([str], np.ndarray(int),
+        np.ndarray(int)), or an error message instead of the patterns
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        if any(len(pattern) != rows.shape[1] for pattern in patterns):
+            return "Error:Every pattern must have one character per die.", None, None
+        face_index = {str(face).lower(): code for code, face in enumerate(self.game.faces)}
+        matched_rows, matched_labels = [], []
+        for label, pattern in enumerate(patterns):
+            is_match = np.ones(len(rows), dtype=bool)
+            for position, character in enumerate(pattern.lower()):
+                if character == '?':
+                    continue
+                if character not in face_index:
+                    is_match[:] = False
+                    break
+                is_match &= rows[:, position] == face_index[character]
+            matched_rows.append(np.flatnonzero(is_match))
+            matched_labels.append(np.full(int(is_match.sum()), label, dtype=np.int64))
+        matched_rows.append(np.empty(0, dtype=np.int64))
+        matched_labels.append(np.empty(0, dtype=np.int64))
+        return list(patterns), np.concatenate(matched_rows), np.concatenate(matched_labels)
+
+
+class ExactAnalyzer:
+    """
+    PURPOSE:
+    A class to compute the exact probabilities of the statistics of a Game from the faces and weights of its dice,
+    without rolling them. The results can be compared with the simulated ones of an Analyzer.
+
+    ATTRIBUTES:
+    Takes a Game Object
+
+    METHODS:
+    __init__:: Instantiate from a Game Object and normalize the weights of each die into face probabilities
+    face_count:: Probability of every face appearing 0 to M times in a roll
+    jackpot:: Probability of a roll resulting in all faces being identical
+    combo:: Probability of every combination of faces, order not mattering
+    permutation:: Probability of every sequence of faces, order mattering
+    probability:: Probability of one sequence of faces
+    compare:: Compare the combination probabilities with the frequencies simulated by an Analyzer
+    -------------------------------------------------------------------------
+    """
+
+    # Largest number of sequences the permutation method enumerates
+    max_permutations = 10 ** 7
+
+    def __init__(self, game):
+        """
+        PURPOSE:
+        Initializes the face probabilities of every die of the Game
+
+        INPUTS:
+        Takes one argument which is a Game Object
+
+        OUTPUTS:
+        Assigns the Game faces, the Game cols/columns and the M dice by F faces probability matrix (np.ndarray(float))
+        """
+        self.game = game
+        self.faces = game._game_faces()
+        self.cols = [str(face) for face in self.faces]
+        self.columns = ["Die " + str(index + 1) for index, dice in enumerate(game.dice)]
+        self.face_probabilities = _face_probabilities(game.dice, self.faces)
+        # The cards of a dealt hand are not independent, so the per die probabilities do not multiply
+        self.is_dealt = any(isinstance(die, Deck) for die in game.dice)
+        # Results
+        self.face_count_df = pd.DataFrame()
+        self.jackpot_probabilities = pd.Series(dtype=float)
+        self.combination_df = pd.DataFrame()
+        self.permutation_df = pd.DataFrame()
+
+    def face_count(self):
+        """
+        PURPOSE:
+        Method to compute the distribution of how many times a given face is rolled in each event
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the dataframe of the probability of each face (columns) appearing 0 to M times (rows) in a roll
+        (DataFrame(float))
+        """
+        if self.is_dealt:
+            return "Error:Exact probabilities are not available for dealt hands."
+        # Poisson-binomial distribution of every face, convolving the dice one at a time
+        distribution = np.zeros((len(self.faces), len(self.game.dice) + 1))
+        distribution[:, 0] = 1.0
+        for die_probabilities in self.face_probabilities:
+            rolled = distribution * die_probabilities[:, None]
+            distribution = distribution * (1.0 - die_probabilities[:, None])
+            distribution[:, 1:] += rolled[:, :-1]
+        self.face_count_df = pd.DataFrame(distribution.T, columns=self.cols)
+        self.face_count_df.index.name = 'face count'
+        return self.face_count_df
+
+    def jackpot(self):
+        """
+        PURPOSE:
+        Method to compute the probability of a roll resulting in all faces being identical
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the jackpot probability (float)
+        You can also access the jackpot probability of each face using ExactAnalyzer.jackpot_probabilities
+        """
+        if self.is_dealt:
+            return "Error:Exact probabilities are not available for dealt hands."
+        self.jackpot_probabilities = pd.Series(self.face_probabilities.prod(axis=0), index=self.cols)
+        return float(self.jackpot_probabilities.sum())
+
+    def combo(self):
+        """
+        PURPOSE:
+        Method to compute the probability of every distinct combination of faces, order not mattering
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the count of combinations that can be rolled
+        You can also access the combination probabilities using ExactAnalyzer.combination_df, indexed like the
+        sparse Analyzer.combination_df
+        """
+        if self.is_dealt:
+            return "Error:Exact probabilities are not available for dealt hands."
+        # Identical dice follow a multinomial distribution; the groups of identical dice are then convolved
+        group_probabilities, group_sizes = np.unique(self.face_probabilities, axis=0, return_counts=True)
+        face_counts = np.zeros((1, len(self.faces)), dtype=np.int64)
+        probabilities = np.ones(1)
+        for group_probability, size in zip(group_probabilities, group_sizes):
+            group_counts, group_distribution = self._multinomial(group_probability, int(size))
+            face_counts = (face_counts[:, None, :] + group_counts[None, :, :]).reshape(-1, len(self.faces))
+            probabilities = np.multiply.outer(probabilities, group_distribution).ravel()
+            # Different splits between the groups can give the same face counts, merged in combination order
+            face_counts, probabilities = self._merge_combinations(face_counts, probabilities)
+
+        self.combination_df = pd.DataFrame({'probability': probabilities},
+                                           index=self._faces_index(self._sorted_codes(face_counts)))
+        return len(self.combination_df)
+
+    def _sorted_codes(self, face_counts):
+        """
+        PURPOSE:
+        Turn vectors of face counts into the sorted face codes of the combinations
+
+        INPUTS:
+        Takes the face counts of every combination (np.ndarray(int))
+
+        OUTPUTS:
+        Returns one row of sorted face codes per combination (np.ndarray(int))
+        """
+        # The code at a position is how many faces are already filled up before it
+        filled = np.cumsum(face_counts, axis=1)
+        return (filled[:, None, :] <= np.arange(int(face_counts[0].sum()))[None, :, None]).sum(axis=2)
+
+    def _merge_combinations(self, face_counts, probabilities):
+        """
+        PURPOSE:
+        Add up the probabilities of identical face count vectors and sort them in combination order
+
+        INPUTS:
+        Takes the face counts (np.ndarray(int)) and their probabilities (np.ndarray(float))
+
+        OUTPUTS:
+        Returns the distinct face counts and their probabilities (np.ndarray(int), np.ndarray(float))
+        """
+        rows = self._sorted_codes(face_counts)
+        if len(self.faces) ** rows.shape[1] <= np.iinfo(np.int64).max:
+            radix = len(self.faces) ** np.arange(rows.shape[1] - 1, -1, -1, dtype=np.int64)
+            _, first_rows, inverse = np.unique(rows @ radix, return_index=True, return_inverse=True)
+        else:
+            _, first_rows, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+        merged = np.bincount(inverse.ravel(), weights=probabilities, minlength=len(first_rows))
+        return face_counts[first_rows], merged
+
+    def _multinomial(self, probabilities, number_of_dice):
+        """
+        PURPOSE:
+        Compute the multinomial distribution of the face counts of identical dice
+
+        INPUTS:
+        Takes the face probabilities of the dice (np.ndarray(float)) and how many of them are rolled (int)
+
+        OUTPUTS:
+        Returns every possible vector of face counts and its probability (np.ndarray(int), np.ndarray(float))
+        """
+        possible_faces = np.flatnonzero(probabilities)
+        rolled = np.array(list(combinations_with_replacement(possible_faces.tolist(), number_of_dice)),
+                          dtype=np.int64).reshape(-1, number_of_dice)
+        face_counts = np.zeros((len(rolled), len(probabilities)), dtype=np.int64)
+        for position in range(number_of_dice):
+            face_counts[np.arange(len(rolled)), rolled[:, position]] += 1
+        log_factorials = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, number_of_dice + 1)))])
+        log_probabilities = np.log(probabilities, out=np.zeros_like(probabilities), where=probabilities > 0)
+        log_multinomial = log_factorials[number_of_dice] - log_factorials[face_counts].sum(axis=1) + \
+            face_counts @ log_probabilities
+        return face_counts, np.exp(log_multinomial)
+
+    def permutation(self):
+        """
+        PURPOSE:
+        Method to compute the probability of every sequence of faces, order mattering
+
+        INPUTS:
+        Takes no argument
+
+        OUTPUTS:
+        Returns the count of sequences that can be rolled, or an error when there are more than
+        ExactAnalyzer.max_permutations of them (use the probability method for single sequences)
+        You can also access the sequence probabilities using ExactAnalyzer.permutation_df, indexed like the sparse
+        Analyzer.permutation_df
+        """
+        if self.is_dealt:
+            return "Error:Exact probabilities are not available for dealt hands."
+        if len(self.faces) ** len(self.game.dice) > self.max_permutations:
+            return "Error:There are too many sequences to enumerate, use the probability method instead."
+        # Outer product of the dice, the first die being the most significant like the Analyzer roll keys
+        joint = np.ones(1)
+        for die_probabilities in self.face_probabilities:
+            joint = np.multiply.outer(joint, die_probabilities).ravel()
+        possible = np.flatnonzero(joint)
+        radix = len(self.faces) ** np.arange(len(self.game.dice) - 1, -1, -1, dtype=np.int64)
+        rows = (possible[:, None] // radix) % len(self.faces)
+        self.permutation_df = pd.DataFrame({'probability': joint[possible]}, index=self._faces_index(rows))
+        return len(self.permutation_df)
+
+    def probability(self, sequence):
+        """
+        PURPOSE:
+        Method to compute the probability of rolling one sequence of faces
+
+        INPUTS:
+        Takes one argument which is the face rolled by each die, in die order ([int | str | float])
+
+        OUTPUTS:
+        Returns the probability of the sequence (float)
+        """
+        if self.is_dealt:
+            return "Error:Exact probabilities are not available for dealt hands."
+        if len(sequence) != len(self.game.dice) or any(face not in self.faces for face in sequence):
+            return "Error:The sequence passed is invalid."
+        codes = [self.faces.index(face) for face in sequence]
+        return float(self.face_probabilities[np.arange(len(codes)), codes].prod())
+
+    def compare(self, analyzer):
+        """
+        PURPOSE:
+        Method to compare the exact combination probabilities with the frequencies simulated by an Analyzer
+
+        INPUTS:
+        Takes one argument which is an Analyzer Object of a played Game with the same dice
+
+        OUTPUTS:
+        Returns a dataframe per combination of the probability, the observed count and frequency and the expected
+        count for the number of rolls analyzed (DataFrame(float))
+        """
+        if self.is_dealt:
+            return "Error:Exact probabilities are not available for dealt hands."
+        if self.combination_df.empty:
+            self.combo()
+        analyzer.combo(sparse=True)
+        observed = analyzer.combination_df['count']
+        number_of_rolls = int(observed.sum())
+        comparison = self.combination_df.join(observed.rename('observed'), how='outer')
+        comparison['probability'] = comparison['probability'].fillna(0.0)
+        comparison['observed'] = comparison['observed'].fillna(0).astype(int)
+        comparison['frequency'] = comparison['observed'] / max(number_of_rolls, 1)
+        comparison['expected'] = comparison['probability'] * number_of_rolls
+        return comparison
+
+    def _faces_index(self, rows):
+        """
+        PURPOSE:
+        Build a die by die MultiIndex over the Game faces from rows of face codes
+
+        INPUTS:
+        Takes the rows of face codes (np.ndarray(int))
+
+        OUTPUTS:
+        Returns the MultiIndex (pd.MultiIndex)
+        """
+        return pd.MultiIndex(levels=[pd.Index(self.faces)] * len(self.columns), codes=rows.T, names=self.columns)
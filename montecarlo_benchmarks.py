@@ -0,0 +1,202 @@
+#####################################
+# File name montecarlo_benchmarks.py#
+#####################################
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from montecarlo import Die, Game, Analyzer
+
+DEFAULT_ROLLS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+DEFAULT_DICE = [2, 6, 10]
+DEFAULT_FACES = [2, 6, 26, 52]
+# Cases with more rolls x dice x faces cells than this are skipped to keep the run within memory
+DEFAULT_MAX_CELLS = 2 * 10 ** 8
+# The dense combo and permutation tables hold one row and one column per possible sequence
+DENSE_MAX_SEQUENCES = 2000
+
+
+def _measure(function, repeat):
+    """
+    PURPOSE:
+    Time a benchmark function and profile its peak memory
+
+    INPUTS:
+    Takes the function to call without arguments and the number of timed calls (int)
+
+    OUTPUTS:
+    Returns the best wall time in seconds over the timed calls and the peak bytes allocated by one extra call
+    traced by tracemalloc (float, int)
+    """
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    # Tracing slows the call down, so the memory is profiled in a call of its own
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(seconds), peak_bytes
+
+
+def _cases(number_of_rolls, number_of_dice, number_of_faces):
+    """
+    PURPOSE:
+    Build the benchmark functions of one point of the rolls x dice x faces matrix
+
+    INPUTS:
+    Takes the number of rolls, dice and faces (int, int, int)
+
+    OUTPUTS:
+    Returns the benchmark name and the function to time, or None when the case is too large to run ([(str,
+    function | None)])
+    """
+    die = Die(list(range(1, number_of_faces + 1)))
+    game = Game([die] * number_of_dice, seed=0)
+    # A copy is not the current play of the Game, so its narrow form goes through pd.melt
+    play_df = game.play(number_of_rolls).copy()
+
+    def analyzer_method(name, *args):
+        # Every call analyzes with a new Analyzer so the cached results are not timed
+        return lambda: getattr(Analyzer(game), name)(*args)
+
+    def show_narrow(get_play_df):
+        def function():
+            # The narrow view of the last dataframe shown is cached, so it is dropped to time building it
+            game._narrow_view = None
+            return game.show(get_play_df(), 2)
+        return function
+
+    is_dense_small = number_of_faces ** number_of_dice <= DENSE_MAX_SEQUENCES
+    return [('Die.roll_die', lambda: die.roll_die(number_of_rolls)),
+            ('Game.play', lambda: game.play(number_of_rolls)),
+            ('Game.show wide', lambda: game.show(play_df, 1)),
+            ('Game.show narrow', show_narrow(lambda: game.play_df)),
+            ('Game.show narrow melt', show_narrow(lambda: play_df)),
+            ('Analyzer.summary', analyzer_method('summary')),
+            ('Analyzer.face_count', analyzer_method('face_count')),
+            ('Analyzer.jackpot', analyzer_method('jackpot')),
+            ('Analyzer.combo sparse', analyzer_method('combo', True)),
+            ('Analyzer.permutation sparse', analyzer_method('permutation', True)),
+            ('Analyzer.combo', analyzer_method('combo') if is_dense_small else None),
+            ('Analyzer.permutation', analyzer_method('permutation') if is_dense_small else None)]
+
+
+def run_benchmarks(rolls=None, dice=None, faces=None, repeat=3, max_cells=DEFAULT_MAX_CELLS, log=None):
+    """
+    PURPOSE:
+    Time and memory-profile the Die, Game and Analyzer hot paths across a matrix of rolls, dice and faces
+
+    INPUTS:
+    Takes the numbers of rolls, dice and faces to combine ([int]), the number of timed calls per benchmark (int),
+    the largest rolls x dice x faces case to run (int) and an optional file to report progress to
+
+    OUTPUTS:
+    Returns the machine-readable report with the environment and one result per benchmark and case (dict). Cases
+    too large or benchmarks that raise are kept with 'skipped' or 'error' instead of a time
+    """
+    results = []
+    for number_of_rolls in DEFAULT_ROLLS if rolls is None else rolls:
+        for number_of_dice in DEFAULT_DICE if dice is None else dice:
+            for number_of_faces in DEFAULT_FACES if faces is None else faces:
+                case = {'rolls': number_of_rolls, 'dice': number_of_dice, 'faces': number_of_faces}
+                if number_of_rolls * number_of_dice * number_of_faces > max_cells:
+                    results.append(dict(case, name='*', skipped='larger than max cells'))
+                    continue
+                for name, function in _cases(number_of_rolls, number_of_dice, number_of_faces):
+                    result = dict(case, name=name)
+                    if function is None:
+                        result['skipped'] = 'too many sequences for the dense table'
+                    else:
+                        try:
+                            result['seconds'], result['peak_bytes'] = _measure(function, repeat)
+                        except Exception as error:
+                            result['error'] = '{}: {}'.format(type(error).__name__, error)
+                    results.append(result)
+                    if log is not None:
+                        print(json.dumps(result), file=log, flush=True)
+    return {'environment': {'python': platform.python_version(), 'numpy': np.__version__,
+                            'pandas': pd.__version__, 'platform': platform.platform(),
+                            'date': datetime.now(timezone.utc).isoformat()},
+            'results': results}
+
+
+def compare(report, baseline, threshold=0.2, min_seconds=0.001):
+    """
+    PURPOSE:
+    Compare a benchmark report with a saved baseline
+
+    INPUTS:
+    Takes the new report and the baseline report (dict, dict), the relative slow down tolerated (float) and the time
+    below which a benchmark is too fast to be told apart from timer noise (float)
+
+    OUTPUTS:
+    Returns one row per benchmark timed in both reports with the baseline and new times, their ratio and whether it
+    is a regression beyond the threshold (DataFrame)
+    """
+    def timed(results):
+        return {(result['name'], result['rolls'], result['dice'], result['faces']): result['seconds']
+                for result in results['results'] if 'seconds' in result}
+
+    baseline_seconds, new_seconds = timed(baseline), timed(report)
+    rows = [key + (baseline_seconds[key], new_seconds[key]) for key in new_seconds if key in baseline_seconds]
+    comparison = pd.DataFrame(rows, columns=['name', 'rolls', 'dice', 'faces', 'baseline seconds', 'seconds'])
+    comparison['ratio'] = comparison['seconds'] / comparison['baseline seconds']
+    comparison['regression'] = (comparison['ratio'] > 1 + threshold) & (comparison['seconds'] > min_seconds)
+    return comparison
+
+
+def main(argv=None):
+    """
+    PURPOSE:
+    Command line entry point: run the benchmarks, write the JSON report and gate on a baseline
+
+    INPUTS:
+    Takes the command line arguments ([str]), see --help
+
+    OUTPUTS:
+    Returns the exit status, 1 when a benchmark regressed beyond the threshold (int)
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Die, Game and Analyzer hot paths.')
+    parser.add_argument('--rolls', type=int, nargs='+', default=DEFAULT_ROLLS)
+    parser.add_argument('--dice', type=int, nargs='+', default=DEFAULT_DICE)
+    parser.add_argument('--faces', type=int, nargs='+', default=DEFAULT_FACES)
+    parser.add_argument('--repeat', type=int, default=3, help='timed calls per benchmark, the best one is kept')
+    parser.add_argument('--max-cells', type=int, default=DEFAULT_MAX_CELLS,
+                        help='skip cases with more rolls x dice x faces')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON report to write')
+    parser.add_argument('--baseline', help='JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative slow down counted as a regression')
+    arguments = parser.parse_args(argv)
+
+    report = run_benchmarks(arguments.rolls, arguments.dice, arguments.faces, arguments.repeat,
+                            arguments.max_cells, log=sys.stderr)
+    with open(arguments.output, 'w') as output:
+        json.dump(report, output, indent=1)
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline) as baseline:
+        comparison = compare(report, json.load(baseline), arguments.threshold)
+    print(comparison.to_string(index=False))
+    regressions = comparison[comparison['regression']]
+    if len(regressions):
+        print('{} benchmark(s) slower than the baseline by more than {:.0%}'.format(len(regressions),
+                                                                                    arguments.threshold))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,18 @@
 ###############################
 # File name montecarlo_test.py#
 ###############################
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from collections import Counter
+import numpy as np
 import pandas as pd
-from montecarlo import Die, Game, Analyzer
+from montecarlo import Die, Deck, Game, Analyzer, ExactAnalyzer, Summary, Stats, WordIndex, PARALLEL_BLOCK_ROLLS, \
+    BACKENDS, PYTHON_BACKEND_MAX_CELLS
+from montecarlo import _select_backend
+import montecarlo_benchmarks
 
 
 class MonteCarloTestSuite(unittest.TestCase):
@@ -100,6 +109,24 @@ class MonteCarloTestSuite(unittest.TestCase):
         self.assertEqual(len(actual), expected)
         self.assertTrue(type(actual), type(expected_class_type))
 
+    def test_roll_die_honors_weights(self):
+        """Test a loaded coin lands on its heavy face in proportion to the weights"""
+        self.coin_die.change_weight('Heads', 9)
+        actual = self.coin_die.roll_die(20000, rng=np.random.default_rng(3)).count('Heads') / 20000
+        expected = 0.9
+        self.assertAlmostEqual(actual, expected, delta=0.01)
+
+    def test_change_weight_invalidates_sampler(self):
+        """Test a zero weight face is never rolled once the sampler is rebuilt"""
+        self.number_die.roll_die(10)
+        self.number_die.change_weight(6, 0)
+        actual = self.number_die.roll_die(5000)
+        self.assertNotIn(6, actual)
+        for face in [1, 2, 3, 4, 5]:
+            self.number_die.change_weight(face, 0)
+        self.assertRaises(ValueError, self.number_die.roll_die, 5)
+        self.assertEqual(Game([self.number_die]).play(5), "Error:The die weights must add up to a positive value.")
+
     def test_show_number_die_state(self):
         """Test if the correct state is being displayed to the user, Shape , Length and Type"""
         actual = self.number_die.faces_weights_df
@@ -156,6 +183,41 @@ class MonteCarloTestSuite(unittest.TestCase):
         self.assertEqual(len(actual), expected_length)
         self.assertEqual(actual.shape, expected_shape)
 
+    def test_play_game_seed_is_reproducible(self):
+        """Play two games with the same seed and expect identical results"""
+        first_game = Game([self.number_die, self.number_die], seed=7)
+        second_game = Game([self.number_die, self.number_die], seed=7)
+        actual = first_game.play(100)
+        expected = second_game.play(100)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_play_game_parallel_same_result_for_any_worker_count(self):
+        """Play the same seeded game with one and with two worker processes and expect identical results"""
+        self.number_die.change_weight(3, 4)
+        serial_game = Game([self.number_die, self.number_die], seed=21)
+        parallel_game = Game([self.number_die, self.number_die], seed=21)
+        expected = serial_game.play(PARALLEL_BLOCK_ROLLS + 10, workers=1)
+        actual = parallel_game.play(PARALLEL_BLOCK_ROLLS + 10, workers=2)
+        pd.testing.assert_frame_equal(actual, expected)
+        np.testing.assert_array_equal(parallel_game.codes, serial_game.codes)
+
+    def test_play_game_faces_and_index(self):
+        """Play a large game and expect only valid faces indexed by roll number starting at 1"""
+        actual = self.coin_game.play(1000)
+        self.assertEqual(actual.index.name, 'roll number')
+        self.assertEqual(actual.index[0], 1)
+        self.assertEqual(actual.index[-1], 1000)
+        self.assertTrue(actual.isin(self.coin_die.faces).all().all())
+
+    def test_play_game_compact_categorical(self):
+        """Play a compact game and expect Categorical columns that decode back to the integer codes"""
+        actual = self.coin_game.play(50, compact=True)
+        self.assertTrue(all(isinstance(dtype, pd.CategoricalDtype) for dtype in actual.dtypes))
+        self.assertEqual(self.coin_game.codes.dtype, np.uint8)
+        self.assertEqual(self.coin_game.codes.shape, (50, 2))
+        expected = [[self.coin_game.faces[code] for code in row] for row in self.coin_game.codes]
+        self.assertEqual(actual.astype(object).values.tolist(), expected)
+
     def test_show_game_number_die(self):
         """Show the correct game play result output """
         actual = self.die_game.show(self.die_game.play(10), 1)
@@ -180,6 +242,33 @@ class MonteCarloTestSuite(unittest.TestCase):
         self.assertEqual(actual.shape, expected_shape)
         self.assertTrue(type(actual), expected_class_type)
 
+    def test_show_narrow_view_and_bounded_history(self):
+        """Test the narrow form matches pd.melt and is reused, and only the last dataframes shown are kept"""
+        play_df = self.coin_game.play(20)
+        actual = self.coin_game.show(play_df, 2)
+        expected = pd.melt(play_df, value_vars=['Die 1', 'Die 2'], var_name='die number', value_name='face rolled',
+                           ignore_index=False)
+        self.assertTrue(actual.astype({'die number': object}).equals(expected))
+        self.assertIs(self.coin_game.show(play_df, 2), actual)
+        melted = self.coin_game.show(play_df.copy(), 2)
+        self.assertEqual(melted['die number'].dtype, actual['die number'].dtype)
+        heads = play_df.copy()
+        heads[:] = 'Heads'
+        self.coin_game.play_df = heads
+        self.assertEqual(set(self.coin_game.show(self.coin_game.play_df, 2)['face rolled']), {'Heads'})
+        heads.iloc[0, 0] = 'Tails'
+        self.assertEqual(self.coin_game.show(heads, 2)['face rolled'].tolist().count('Tails'), 1)
+        die_game = Game([self.number_die] * 2, history_size=2)
+        shown = [die_game.show(die_game.play(5, append=True), 1) for _ in range(3)]
+        self.assertEqual(len(die_game.play_result_df_list), 2)
+        self.assertIs(die_game.play_result_df_list[-1], shown[-1])
+        die_game.show(shown[0], 2)
+        die_game.history_size = 0
+        die_game.show(shown[0], 1)
+        self.assertEqual(len(die_game.play_result_df_list), 0)
+        die_game.show(shown[0], 2)
+        self.assertIsNone(die_game._narrow_view)
+
     def test_create_analyzer_number_die(self):
         """Test created Analyzer class is correct and infers the datatype from the Game Object"""
         actual = Analyzer(self.die_game)
@@ -210,6 +299,17 @@ class MonteCarloTestSuite(unittest.TestCase):
         self.assertEqual(actual.empty, expected_dataframe_data_type.empty)
         self.assertEqual(len(actual), expected_list)
 
+    def test_face_count_matches_rolls(self):
+        """Test the face count of every roll against a direct count of the played faces"""
+        self.die_game.play(200)
+        analyzer = Analyzer(self.die_game)
+        actual = analyzer.face_count()
+        self.assertEqual(actual.shape, (200, 6))
+        self.assertEqual(list(actual.columns), self.die_game.cols)
+        for roll_number, row in self.die_game.play_df.iterrows():
+            expected = [list(row).count(face) for face in self.die_game.faces]
+            self.assertEqual(actual.loc[roll_number].tolist(), expected)
+
     def test_jackpot_number_die(self):
         """ Test the Jackpot method returns a count of strict type integer"""
         actual = self.die_analyzer.jackpot()
@@ -250,6 +350,17 @@ class MonteCarloTestSuite(unittest.TestCase):
         self.assertEqual(str(exception_context.exception), "Must pass non-zero number of levels/codes")
         self.assertIsInstance(len(self.coin_analyzer.combination_list), int)
 
+    def test_combo_sparse_counts_observed_combinations(self):
+        """Test the sparse combo counts every rolled combination regardless of the order of the dice"""
+        self.die_game.play(500)
+        analyzer = Analyzer(self.die_game)
+        actual = analyzer.combo(sparse=True)
+        positions = {face: index for index, face in enumerate(self.die_game.faces)}
+        expected = Counter(tuple(sorted(row, key=positions.get)) for row in self.die_game.play_df.values.tolist())
+        self.assertEqual(actual, len(expected))
+        self.assertEqual(analyzer.combination_df['count'].sum(), 500)
+        self.assertEqual({combination[:-1]: combination[-1] for combination in analyzer.combination_list}, expected)
+
     def test_permutation_number_die_exception(self):
         """ Test return type is Integer ,Permutation if nothing is passed and prove the permutation dataframe is
         built from the permutation List . """
@@ -272,6 +383,419 @@ class MonteCarloTestSuite(unittest.TestCase):
         self.assertEqual(str(exception_context.exception), "Must pass non-zero number of levels/codes")
         self.assertIsInstance(len(self.coin_analyzer.permutation_list), int)
 
+    def test_permutation_sparse_counts_observed_sequences(self):
+        """Test the sparse permutation counts every rolled sequence with the order of the dice mattering"""
+        self.coin_game.play(300)
+        analyzer = Analyzer(self.coin_game)
+        actual = analyzer.permutation(sparse=True)
+        expected = Counter(tuple(row) for row in self.coin_game.play_df.values.tolist())
+        self.assertEqual(actual, len(expected))
+        self.assertEqual(analyzer.permutation_df['count'].to_dict(), expected)
+        self.assertEqual(list(analyzer.permutation_df.index.names), self.coin_game.columns)
+
+    def test_jackpot_matches_identical_rolls(self):
+        """Test the jackpot count and roll numbers against a direct check of the played rolls"""
+        self.coin_game.play(400)
+        analyzer = Analyzer(self.coin_game)
+        actual = analyzer.jackpot()
+        expected = [roll_number for roll_number, row in self.coin_game.play_df.iterrows() if len(set(row)) == 1]
+        self.assertEqual(actual, len(expected))
+        self.assertEqual(analyzer.jackpot_results_df.index.tolist(), expected)
+        self.assertTrue((analyzer.jackpot_results_df.sum(axis=1) == 2).all())
+
+    def test_outcome_keys_fall_back_to_hashing(self):
+        """Test the roll keys of a game too large for mixed-radix integers still group identical rolls"""
+        letter_die = Die(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+        letter_game = Game([letter_die] * 16, seed=11)
+        letter_game.play(100)
+        letter_game.play_df.iloc[1] = letter_game.play_df.iloc[0]
+        letter_game.codes[1] = letter_game.codes[0]
+        analyzer = Analyzer(letter_game)
+        actual = analyzer.permutation(sparse=True)
+        self.assertEqual(actual, 99)
+        self.assertEqual(analyzer.permutation_keys[0], analyzer.permutation_keys[1])
+        self.assertEqual(analyzer.permutation_df['count'].max(), 2)
+
+    def test_play_stream_matches_full_analysis(self):
+        """Test the streamed totals against the Analyzer of the same rolls played at once"""
+        stream_analyzer = Analyzer(self.die_game)
+        chunks = []
+        for chunk in self.die_game.play_stream(1050, 100):
+            self.assertLessEqual(len(chunk), 100)
+            stream_analyzer.update(chunk)
+            chunks.append(chunk)
+        self.die_game.codes = np.concatenate(chunks)
+        self.die_game.play_df = self.die_game._build_play_df(self.die_game.codes)
+        self.die_game.number_of_rolls = 1050
+        full_analyzer = Analyzer(self.die_game)
+        self.assertEqual(stream_analyzer.face_count().loc['total'].tolist(), full_analyzer.face_count().sum().tolist())
+        self.assertEqual(stream_analyzer.jackpot(), full_analyzer.jackpot())
+        self.assertEqual(stream_analyzer.combo(sparse=True), full_analyzer.combo(sparse=True))
+        self.assertEqual(stream_analyzer.combination_list, full_analyzer.combination_list)
+        self.assertEqual(stream_analyzer.permutation(sparse=True), full_analyzer.permutation(sparse=True))
+        pd.testing.assert_frame_equal(stream_analyzer.permutation_df, full_analyzer.permutation_df)
+
+    def test_exact_analyzer_fair_dice(self):
+        """Test the exact probabilities of two fair six sided dice"""
+        exact_analyzer = ExactAnalyzer(self.die_game)
+        self.assertAlmostEqual(exact_analyzer.jackpot(), 1 / 6)
+        self.assertEqual(exact_analyzer.combo(), 21)
+        self.assertAlmostEqual(exact_analyzer.combination_df['probability'].sum(), 1.0)
+        self.assertAlmostEqual(exact_analyzer.combination_df.loc[(1, 2), 'probability'], 2 / 36)
+        self.assertEqual(exact_analyzer.permutation(), 36)
+        self.assertAlmostEqual(exact_analyzer.probability([6, 6]), 1 / 36)
+        face_count_df = exact_analyzer.face_count()
+        self.assertEqual(face_count_df.shape, (3, 6))
+        self.assertAlmostEqual(face_count_df.loc[0, '1'], 25 / 36)
+
+    def test_exact_analyzer_weighted_dice_against_simulation(self):
+        """Test the exact combination probabilities of loaded coins against a large simulation"""
+        self.coin_die.change_weight('Heads', 3)
+        coin_game = Game([self.coin_die, self.coin_die, Die(['Heads', 'Tails'])], seed=5)
+        exact_analyzer = ExactAnalyzer(coin_game)
+        self.assertAlmostEqual(exact_analyzer.jackpot(), 0.75 * 0.75 * 0.5 + 0.25 * 0.25 * 0.5)
+        coin_game.play(20000)
+        comparison = exact_analyzer.compare(Analyzer(coin_game))
+        self.assertEqual(comparison['observed'].sum(), 20000)
+        self.assertLess((comparison['frequency'] - comparison['probability']).abs().max(), 0.02)
+
+    def test_play_until_reaches_precision(self):
+        """Test the sequential play stops once the jackpot interval is narrow enough and reports the rolls used"""
+        die_game = Game([self.number_die, self.number_die], seed=3)
+        actual = die_game.play_until('jackpot', precision=0.01, batch_size=1000)
+        self.assertTrue(actual['precision reached'])
+        self.assertLessEqual(actual['half width'], 0.01)
+        self.assertLess(actual['rolls'], 10000)
+        self.assertEqual(die_game.number_of_rolls, actual['rolls'])
+        self.assertLessEqual(actual['lower'], 1 / 6)
+        self.assertGreaterEqual(actual['upper'], 1 / 6)
+
+    def test_play_until_respects_roll_budget(self):
+        """Test the sequential play stops at the roll budget and rejects an unknown face"""
+        actual = self.coin_game.play_until('face', 'Heads', precision=0.0001, batch_size=300, max_rolls=1000)
+        self.assertFalse(actual['precision reached'])
+        self.assertEqual(actual['rolls'], 1000)
+        self.assertEqual(actual['trials'], 2000)
+        self.assertEqual(self.coin_game.play_until('face', 'Edge'), "Error:The face passed is invalid.")
+
+    def test_importance_sampling_rare_jackpot(self):
+        """Test the importance sampled jackpot estimate of six dice against the exact probability"""
+        die_game = Game([self.number_die] * 6, seed=8)
+        die_game.play(20000, sampling='importance')
+        self.assertEqual(die_game.roll_weights.shape, (20000,))
+        actual = Analyzer(die_game).jackpot_estimate()
+        expected = ExactAnalyzer(die_game).jackpot()
+        self.assertLess(actual['standard error'], expected / 10)
+        self.assertLess(abs(actual['estimate'] - expected), 4 * actual['standard error'])
+
+    def test_variance_reduced_combo_estimates(self):
+        """Test the stratified and antithetic combination estimates add up to one and match the exact ones"""
+        exact_analyzer = ExactAnalyzer(self.coin_game)
+        exact_analyzer.combo()
+        for sampling in ['stratified', 'antithetic']:
+            self.coin_game.play(4000, sampling=sampling)
+            actual = Analyzer(self.coin_game).combo_estimate().join(exact_analyzer.combination_df)
+            self.assertAlmostEqual(actual['estimate'].sum(), 1.0)
+            self.assertTrue(((actual['estimate'] - actual['probability']).abs() < 4 * actual['standard error']).all())
+        self.assertEqual(self.coin_game.play(10, sampling='lucky'),
+                         "Error:The sampling can only be 'plain', 'importance', 'stratified' or 'antithetic'.")
+
+    def test_sweep_scenarios(self):
+        """Test a sweep summarizes every scenario from the same draws, and a certain face always hits the jackpot"""
+        loaded_die = Die([1, 2, 3, 4, 5, 6])
+        loaded_die.change_weight(6, 5)
+        die_game = Game([self.number_die] * 3, seed=13)
+        actual = die_game.sweep({'fair': [1] * 6, 'sixes': [0, 0, 0, 0, 0, 1], 'loaded': [loaded_die] * 3}, 5000)
+        self.assertEqual(list(actual.index), ['fair', 'sixes', 'loaded'])
+        self.assertTrue(np.allclose(actual[[str(face) for face in range(1, 7)]].sum(axis=1), 1.0))
+        self.assertEqual(actual.loc['sixes', 'jackpot rate'], 1.0)
+        self.assertEqual(actual.loc['sixes', 'top combos'], [((6, 6, 6), 1.0)])
+        self.assertGreater(actual.loc['loaded', '6'], actual.loc['fair', '6'])
+        self.assertEqual(die_game.sweep([[1, 2]], 10),
+                         "Error:The scenario weights must be non-negative with one weight per face of the Game.")
+        self.assertEqual(die_game.sweep([[[1] * 6] * 2], 10),
+                         "Error:The scenario weights must be non-negative with one weight per face of the Game.")
+
+    def test_play_append_incremental_analyzer(self):
+        """Test appended rolls extend the play and an existing Analyzer folds them in like a fresh one"""
+        die_game = Game([self.number_die] * 3, seed=14)
+        die_game.play(300)
+        analyzer = Analyzer(die_game)
+        analyzer.jackpot()
+        analyzer.combo(sparse=True)
+        added = die_game.play(200, append=True)
+        self.assertEqual(list(added.index), list(range(301, 501)))
+        self.assertEqual(list(die_game.play_df.index), list(range(1, 501)))
+        self.assertEqual(die_game.number_of_rolls, 500)
+        fresh_analyzer = Analyzer(die_game)
+        self.assertEqual(analyzer.jackpot(), fresh_analyzer.jackpot())
+        self.assertEqual(analyzer.combo(sparse=True), fresh_analyzer.combo(sparse=True))
+        self.assertTrue(analyzer.combination_df.equals(fresh_analyzer.combination_df))
+        self.assertTrue(analyzer.face_count().equals(fresh_analyzer.face_count()))
+        self.assertEqual(analyzer.processed_rolls, 500)
+        self.assertEqual(die_game.play(10, sampling='antithetic', append=True),
+                         "Error:Only plain plays can be appended to.")
+        self.assertEqual(die_game.play(10, compact=True, append=True),
+                         "Error:The rolls appended must be compact exactly when the play appended to is.")
+        # Rolls are never appended into memory the Game did not allocate
+        user_codes = np.zeros((600, 3), dtype=die_game.codes.dtype)
+        user_codes[:500] = die_game.codes
+        die_game.codes = user_codes[:500]
+        die_game.play(50, append=True)
+        self.assertEqual(int(user_codes[500:].sum()), 0)
+        self.assertEqual(len(die_game.codes), 550)
+        die_game.play_df = die_game.play_df.copy()
+        self.assertEqual(die_game.play(10, append=True),
+                         "Error:The play dataframe was replaced since the play appended to.")
+
+    def test_analyzer_cache_invalidation(self):
+        """Test repeated statistics come from the cache, and a replay or weight change recomputes them"""
+        die_game = Game([self.number_die] * 2, seed=15)
+        die_game.play(100)
+        analyzer = Analyzer(die_game)
+        analyzer.face_count()
+        self.assertIs(analyzer.face_count(), analyzer.face_count_df)
+        self.assertIn(('face_count',), analyzer.cache)
+        die_game.play(40)
+        self.assertEqual(len(analyzer.face_count()), 40)
+        self.number_die.change_weight(6, 2)
+        analyzer.jackpot()
+        self.assertIn(('jackpot',), analyzer.cache)
+        self.assertNotIn(('face_count',), analyzer.cache)
+        die_game.play_df = die_game.play_df.iloc[:10]
+        self.assertEqual(len(analyzer.face_count()), 10)
+        # A frame of the same length but other faces is analyzed from its own contents
+        die_game.play(40)
+        analyzer.combo(sparse=True)
+        sixes = die_game.play_df.copy()
+        sixes[:] = 6
+        die_game.play_df = sixes
+        self.assertEqual(analyzer.jackpot(), 40)
+        self.assertEqual(analyzer.face_count().sum().to_dict(), {'1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 80})
+        self.assertEqual(analyzer.combo(sparse=True), 1)
+        self.assertEqual(analyzer.combination_df['count'].tolist(), [40])
+        # A replay after streaming starts over from the new play as well
+        for chunk in die_game.play_stream(1000, 300):
+            analyzer.update(chunk)
+        self.assertEqual(analyzer.face_count().index.tolist(), ['total'])
+        die_game.play(10)
+        self.assertEqual(len(analyzer.face_count()), 10)
+        self.assertEqual(analyzer.jackpot(), Analyzer(die_game).jackpot())
+
+    def test_summary_single_pass(self):
+        """Test the summary holds every statistic and the individual methods agree with it"""
+        die_game = Game([self.number_die] * 3, seed=16)
+        die_game.play(400)
+        analyzer = Analyzer(die_game)
+        actual = analyzer.summary()
+        self.assertIsInstance(actual, Summary)
+        self.assertEqual(actual.rolls, 400)
+        self.assertEqual(actual.face_totals.sum(), 1200)
+        self.assertEqual(actual.jackpots, analyzer.jackpot())
+        self.assertEqual(list(actual.jackpot_rolls), list(analyzer.jackpot_results_df.index))
+        self.assertEqual(len(actual.combinations), analyzer.combo(sparse=True))
+        self.assertEqual(len(actual.permutations), analyzer.permutation(sparse=True))
+        self.assertTrue((analyzer.face_count().sum() == actual.face_totals).all())
+
+    def test_play_to_file_and_analyze(self):
+        """Test a play written to a memory-mapped file is analyzed chunk by chunk like the stored rolls"""
+        die_game = Game([self.coin_die] * 3, seed=17)
+        with tempfile.TemporaryDirectory() as directory:
+            path = die_game.play_to_file(os.path.join(directory, 'coins.npy'), 1000, chunk_size=300)
+            self.assertTrue(os.path.exists(path + '.json'))
+            analyzer = Analyzer.from_file(path, chunk_size=128)
+            stored = np.array(die_game.faces, dtype=object)[np.load(path)]
+            self.assertEqual(analyzer.store.shape, (1000, 3))
+            analyzer.store = None
+        self.assertEqual(analyzer.jackpot(), int((stored == stored[:, :1]).all(axis=1).sum()))
+        self.assertEqual(analyzer.face_count().loc['total', 'Heads'], int((stored == 'Heads').sum()))
+        self.assertEqual(analyzer.combo(sparse=True), len({tuple(sorted(row)) for row in stored.tolist()}))
+
+    def test_from_file_loads_saved_summary(self):
+        """Test reopening a stored play loads its saved statistics, the same as folding the stored rolls again"""
+        die_game = Game([self.number_die] * 3, seed=23)
+        with tempfile.TemporaryDirectory() as directory:
+            path = die_game.play_to_file(os.path.join(directory, 'dice.npy'), 2000, chunk_size=700)
+            self.assertTrue(os.path.exists(path + '.summary.npz'))
+            loaded = Analyzer.from_file(path)
+            os.remove(path + '.summary.npz')
+            folded = Analyzer.from_file(path, chunk_size=300)
+            loaded.store = folded.store = None
+        self.assertEqual(loaded.streamed_rolls, 2000)
+        self.assertEqual(loaded.jackpot(), folded.jackpot())
+        pd.testing.assert_frame_equal(loaded.face_count(), folded.face_count())
+        self.assertEqual(loaded.combo(sparse=True), folded.combo(sparse=True))
+        pd.testing.assert_frame_equal(loaded.combination_df, folded.combination_df)
+
+    def test_play_checkpointed_resume(self):
+        """Test a run interrupted after a checkpoint resumes to the result of an uninterrupted run"""
+        class InterruptedAnalyzer(Analyzer):
+            def update(self, chunk):
+                if self.streamed_rolls >= 500:
+                    raise KeyboardInterrupt
+                Analyzer.update(self, chunk)
+
+        with tempfile.TemporaryDirectory() as directory:
+            expected = Game([self.number_die] * 3, seed=18).play_checkpointed(
+                1050, os.path.join(directory, 'whole.npz'), chunk_size=100, checkpoint_every=2)
+            checkpoint = os.path.join(directory, 'interrupted.npz')
+            interrupted_game = Game([self.number_die] * 3, seed=18)
+            with self.assertRaises(KeyboardInterrupt):
+                interrupted_game.play_checkpointed(1050, checkpoint, InterruptedAnalyzer(interrupted_game),
+                                                   chunk_size=100, checkpoint_every=2)
+            actual = Game([self.number_die] * 3).play_checkpointed(1050, checkpoint, chunk_size=100,
+                                                                   checkpoint_every=2)
+            self.assertEqual(Game([self.number_die] * 3).play_checkpointed(10, checkpoint),
+                             "Error:The checkpoint was saved by a different play.")
+            loaded_die = Die([1, 2, 3, 4, 5, 6])
+            loaded_die.change_weight(6, 2)
+            self.assertEqual(Game([loaded_die] * 3).play_checkpointed(1050, checkpoint, chunk_size=100,
+                                                                      checkpoint_every=2),
+                             "Error:The checkpoint was saved by a different play.")
+        self.assertEqual(actual.streamed_rolls, 1050)
+        self.assertEqual(actual.jackpot(), expected.jackpot())
+        self.assertTrue(actual.face_count().equals(expected.face_count()))
+        self.assertEqual(actual.combo(sparse=True), expected.combo(sparse=True))
+        self.assertTrue(actual.combination_df.equals(expected.combination_df))
+        self.assertEqual(actual.permutation(sparse=True), expected.permutation(sparse=True))
+        self.assertTrue(actual.permutation_df.equals(expected.permutation_df))
+
+    def test_benchmarks_report_and_compare(self):
+        """Test the benchmark report covers every hot path and the comparison flags a slow down"""
+        report = montecarlo_benchmarks.run_benchmarks(rolls=[100], dice=[2], faces=[6], repeat=1)
+        names = {result['name'] for result in report['results']}
+        self.assertIn('Game.play', names)
+        self.assertIn('Analyzer.combo', names)
+        self.assertTrue(all('seconds' in result or 'error' in result or 'skipped' in result
+                            for result in report['results']))
+        slower = {'results': [dict(result, seconds=result['seconds'] * 2 + 1)
+                              for result in report['results'] if 'seconds' in result]}
+        actual = montecarlo_benchmarks.compare(slower, report, threshold=0.5)
+        self.assertTrue(actual['regression'].all())
+        self.assertFalse(montecarlo_benchmarks.compare(report, report)['regression'].any())
+
+    def test_instrumentation_stats_and_hook(self):
+        """Test an instrumented Game records its phases and the cache use of its Analyzer, and calls the hook"""
+        self.assertIsNone(self.die_game.stats)
+        phases = []
+        stats = self.die_game.instrument(lambda phase, seconds, rolls, result_bytes: phases.append((phase, rolls)))
+        self.assertIsInstance(stats, Stats)
+        self.die_game.play(300)
+        analyzer = Analyzer(self.die_game)
+        analyzer.jackpot()
+        analyzer.jackpot()
+        self.assertEqual(phases[:2], [('sample', 300), ('dataframe', 300)])
+        self.assertIn(('fold', 300), phases)
+        self.assertEqual((stats.cache_hits, stats.cache_misses), (1, 2))
+        actual = stats.to_frame()
+        self.assertEqual(actual.loc['sample', 'rolls'], 300)
+        self.assertGreater(actual.loc['dataframe', 'peak bytes'], 0)
+        self.assertEqual(stats.peak_bytes, actual['peak bytes'].max())
+
+    def test_match_words_modes(self):
+        """Test exact, substring and pattern matches of letter dice rolls against a direct check of every roll"""
+        letter_die = Die(list('ABCDE'))
+        letter_game = Game([letter_die] * 4, seed=21)
+        letter_game.play(3000)
+        rolled = [''.join(row).lower() for row in letter_game.play_df.values.tolist()]
+        words = [rolled[0], rolled[1], 'bad', 'cab', 'ace', 'zebra', 'Dead']
+        analyzer = Analyzer(letter_game)
+        word_index = WordIndex(words, letter_game.faces)
+        self.assertNotIn(5, word_index.keys)
+        lower_words = [word.lower() for word in words]
+        self.assertEqual(analyzer.match_words(word_index), sum(roll in lower_words for roll in rolled))
+        self.assertEqual(analyzer.word_match_df.loc[rolled[0], 'count'], rolled.count(rolled[0]))
+        expected = [any(word in roll for word in ['bad', 'cab', 'ace', 'dead'] + rolled[:2]) for roll in rolled]
+        self.assertEqual(analyzer.match_words(words, 'substring'), sum(expected))
+        self.assertEqual(list(analyzer.word_match_rolls), [number + 1 for number, hit in enumerate(expected) if hit])
+        self.assertEqual(analyzer.match_words(['a??e'], 'pattern'),
+                         sum(roll[0] == 'a' and roll[3] == 'e' for roll in rolled))
+        self.assertEqual(analyzer.match_words(['a?'], 'pattern'),
+                         "Error:Every pattern must have one character per die.")
+
+    def test_lightweight_die_and_lazy_pandas(self):
+        """Test the die keeps no instance dict, builds its state dataframe on demand and rolling skips pandas"""
+        self.assertFalse(hasattr(self.number_die, '__dict__'))
+        self.assertIs(self.number_die.show_state(), self.number_die.faces_weights_df)
+        self.number_die.change_weight(3, 4.0)
+        self.assertEqual(self.number_die.faces_weights_df.loc[self.number_die.faces.index(3), 'weights'], 4.0)
+        script = ("import sys; from montecarlo import Die, Game; die = Die([1, 2, 3]); die.roll_die(5); "
+                  "list(Game([die, die], seed=1).play_stream(10)); print('pandas' in sys.modules)")
+        actual = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(actual.stdout.strip(), 'False')
+
+    def test_deck_deals_without_replacement(self):
+        """Test dealt hands never repeat a card and plug into the Analyzer like rolls of dice"""
+        deck = Deck([rank + suit for rank in 'A23456789TJQK' for suit in 'SHDC'])
+        card_game = Game([deck] * 5, seed=24)
+        card_game.play(20000)
+        sorted_codes = np.sort(card_game.codes, axis=1)
+        self.assertTrue((sorted_codes[:, 1:] != sorted_codes[:, :-1]).all())
+        analyzer = Analyzer(card_game)
+        self.assertEqual(analyzer.face_count().values.sum(), 100000)
+        self.assertEqual(analyzer.jackpot(), 0)
+        # Every card is equally likely in every slot of the hand
+        self.assertLess(abs(analyzer.face_count().sum().values / 100000 - 1 / 52).max(), 0.002)
+        self.assertEqual(len(deck.deal(3, 4, np.random.default_rng(0))[2]), 4)
+        self.assertEqual(Game([deck, Deck(['A', 'B'])]).play(3),
+                         "Error:The cards of a hand must all be dealt from the same Deck.")
+
+    def test_deck_copies_and_hand_frequencies(self):
+        """Test a deck with copies of its faces deals four of a kind and hands at their exact rates"""
+        rank_deck = Deck(list('AB') * 2)
+        self.assertEqual(rank_deck.show_state()['copies'].tolist(), [2, 2])
+        rank_game = Game([rank_deck] * 2, seed=25)
+        rank_game.play(60000)
+        # Two cards from A A B B: a pair in 2 of the 6 hands
+        self.assertAlmostEqual(Analyzer(rank_game).jackpot() / 60000, 1 / 3, delta=0.01)
+        self.assertEqual(Game([rank_deck] * 5).play(3), "Error:The hand can not hold more cards than the deck.")
+        exact_analyzer = ExactAnalyzer(rank_game)
+        self.assertEqual(exact_analyzer.jackpot(), "Error:Exact probabilities are not available for dealt hands.")
+        self.assertEqual(exact_analyzer.combo(), "Error:Exact probabilities are not available for dealt hands.")
+
+    def test_backends_conformance(self):
+        """Test every installed backend gives the same rolls and statistics as the pure Python reference"""
+        available = [name for name, backend in BACKENDS.items() if backend.is_available()]
+        rng = np.random.default_rng(26)
+        codes = rng.integers(0, 6, size=(300, 4)).astype(np.uint8)
+        columns, uniforms = rng.integers(0, 6, size=300), rng.random(300)
+        probability, alias = rng.random(6), rng.integers(0, 6, size=6)
+        reference = BACKENDS['python']
+        self.number_die.change_weight(6, 3.0)
+        expected_game = Game([self.number_die] * 3, seed=27, backend='python')
+        expected_game.play(400)
+        expected = Analyzer(expected_game).summary()
+        for name in available:
+            with self.subTest(backend=name):
+                backend = BACKENDS[name]
+                np.testing.assert_array_equal(backend.face_counts(codes, 6, np.uint8),
+                                              reference.face_counts(codes, 6, np.uint8))
+                np.testing.assert_array_equal(backend.row_keys(codes, 6), reference.row_keys(codes, 6))
+                np.testing.assert_array_equal(backend.alias_codes(columns, uniforms, probability, alias),
+                                              reference.alias_codes(columns, uniforms, probability, alias))
+                game = Game([self.number_die] * 3, seed=27, backend=name)
+                game.play(400)
+                np.testing.assert_array_equal(game.codes, expected_game.codes)
+                actual = Analyzer(game).summary()
+                pd.testing.assert_frame_equal(actual.face_counts, expected.face_counts)
+                self.assertEqual(actual.jackpots, expected.jackpots)
+                pd.testing.assert_frame_equal(actual.combinations, expected.combinations)
+                pd.testing.assert_frame_equal(actual.permutations, expected.permutations)
+
+    def test_backend_selection(self):
+        """Test the automatic backend follows the problem size and an explicit backend overrides it"""
+        self.assertEqual(_select_backend('auto', PYTHON_BACKEND_MAX_CELLS).name, 'python')
+        self.assertIn(_select_backend('auto', PYTHON_BACKEND_MAX_CELLS + 1).name, ('numpy', 'numba'))
+        self.assertEqual(_select_backend('python', 10 ** 9).name, 'python')
+        self.assertEqual(Game([self.number_die], backend='fortran').play(3),
+                         "Error:The backend can only be 'auto' or one of 'python', 'numpy', 'numba'.")
+        if not BACKENDS['numba'].is_available():
+            self.assertEqual(Game([self.number_die], backend='numba').play(3),
+                             "Error:The numba backend is not installed.")
+        self.die_game.play(10)
+        self.assertEqual(Analyzer(self.die_game, backend='numpy')._backend(20).name, 'numpy')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=3)